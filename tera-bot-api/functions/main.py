@@ -2,30 +2,13 @@
 # To get started, simply uncomment the below code or create your own.
 # Deploy with `firebase deploy`
 
-import json
-from firebase_functions import https_fn
+import functools
+import itertools
+import time
+import orjson
+from firebase_functions import https_fn, options
 from flask import Request, Response
 from firebase_functions.options import set_global_options
-from firebase_admin import initialize_app
-
-# Importar las funciones para los servicios de login y creación de usuarios
-from src.services.agents.agent_chat_http import chat_agent_http
-from src.services.login.login_user import login_user_http
-from src.services.login.create_user import create_user_http
-
-# Importar las funciones para los servicios de citas
-from src.services.appointment.citas_consultorio import crear_cita
-from src.services.appointment.citas_consultorio import actualizar_cita
-from src.services.appointment.citas_consultorio import listar_citas
-from src.services.appointment.citas_consultorio import eliminar_cita
-
-# Importar las funciones para los servicios para pacientes
-from src.services.patient.patient_service import get_all_patients
-from src.services.patient.patient_service import update_patient_information
-from src.services.patient.patient_service import get_patient_information
-from src.services.patient.patient_service import get_sigsa_information
-from src.services.patient.patient_service import get_medical_record_information
-
 
 # For cost control, you can set the maximum number of containers that can be
 # running at the same time. This helps mitigate the impact of unexpected
@@ -34,9 +17,66 @@ from src.services.patient.patient_service import get_medical_record_information
 # parameter in the decorator, e.g. @https_fn.on_request(max_instances=5).
 set_global_options(max_instances=10)
 
-initialize_app()
+# Los endpoints sensibles a la latencia mantienen una instancia caliente y más
+# memoria (la CPU asignada escala con la memoria); el resto solo sube memoria
+# para acortar el arranque en frío.
+_HOT_ENDPOINT_OPTIONS = dict(min_instances=1, memory=options.MemoryOption.GB_1, concurrency=20)
+_COLD_ENDPOINT_OPTIONS = dict(min_instances=0, memory=options.MemoryOption.GB_1)
 
-@https_fn.on_request()
+# Caché por contenedor del cuerpo JSON de listar_todos_pacientes: (instante, cuerpo).
+# update_patient corre en otros contenedores y no puede invalidarla, así que un
+# cambio puede tardar hasta _PATIENTS_CACHE_TTL segundos en verse en la lista.
+# `?nocache=1` fuerza una lectura nueva.
+_PATIENTS_CACHE_TTL = 30.0
+_patients_cache: tuple[float, bytes] | None = None
+
+def require_method(method: str):
+    """Rechaza con 405 las peticiones cuyo método HTTP no sea `method`.
+    El cuerpo de error se serializa una sola vez al decorar la función.
+    Args:
+        method: Método HTTP permitido, p. ej. "POST" o "GET".
+    """
+    body = orjson.dumps({
+        "success": False,
+        "error": f"Invalid HTTP method. Only {method} requests are allowed."
+    })
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(request: Request) -> Response:
+            if request.method != method:
+                return Response(
+                    body,
+                    status=405,
+                    headers={"Content-Type": "application/json"}
+                )
+            return handler(request)
+        return wrapper
+    return decorator
+
+def _stream_patients_body(patients, started_at: float, default):
+    """Genera el cuerpo JSON de la lista de pacientes registro por registro.
+    `default` convierte los tipos de Firestore que orjson no serializa solo.
+    Al terminar guarda el cuerpo completo en la caché.
+    """
+    global _patients_cache
+    chunks = [b'{"success":true,"patients":[']
+    yield chunks[-1]
+    total = 0
+    for patient in patients:
+        chunks.append((b"," if total else b"") + orjson.dumps(patient, default=default))
+        yield chunks[-1]
+        total += 1
+    chunks.append(b'],"total":' + str(total).encode() + b"}")
+    yield chunks[-1]
+    _patients_cache = (started_at, b"".join(chunks))
+
+# Los servicios se importan dentro de cada función para que un arranque en frío
+# solo cargue las dependencias (agents, chromadb, googleapiclient, ...) del
+# endpoint invocado.
+
+@https_fn.on_request(**_COLD_ENDPOINT_OPTIONS)
+@require_method("POST")
 def create_user(request: Request) -> Response:
     """Create a new user via HTTP request.
     This function creates a new user in Firebase Authentication using the
@@ -47,20 +87,11 @@ def create_user(request: Request) -> Response:
     Returns:
         A HTTP response indicating the result of the operation.
     """
-
-    if request.method != 'POST':
-        body = json.dumps({
-            "success": False,
-            "error": "Invalid HTTP method. Only POST requests are allowed."
-        })
-        return Response(
-            body,
-            status=405,
-            headers={"Content-Type": "application/json"}
-        )
+    from src.services.login.create_user import create_user_http
     return create_user_http(request)
     
 @https_fn.on_request()
+@require_method("POST")
 def login_user(request: Request) -> Response:
     """Authenticate a user via HTTP request.
     This function authenticates a user with the given username and password.
@@ -70,20 +101,11 @@ def login_user(request: Request) -> Response:
     Returns:
         A HTTP response indicating the result of the operation.
     """
-    if request.method != 'POST':
-        body = json.dumps({
-            "success": False,
-            "error": "Invalid HTTP method. Only POST requests are allowed."
-        })
-        return Response(
-            body,
-            status=405,
-            headers={"Content-Type": "application/json"}
-        )
-
+    from src.services.login.login_user import login_user_http
     return login_user_http(request)
 
-@https_fn.on_request()
+@https_fn.on_request(**_HOT_ENDPOINT_OPTIONS)
+@require_method("GET")
 def listar_todos_pacientes(request: Request) -> Response:
     """List all patients in the Firestore database.
     This function retrieves all patient records from the Firestore database.
@@ -92,30 +114,34 @@ def listar_todos_pacientes(request: Request) -> Response:
     Returns:
         A HTTP response containing the list of all patients.
     """
-    if request.method != 'GET':
-        body = json.dumps({
-            "success": False,
-            "error": "Invalid HTTP method. Only GET requests are allowed."
-        })
+    global _patients_cache
+    now = time.monotonic()
+    if (
+        _patients_cache is not None
+        and now - _patients_cache[0] < _PATIENTS_CACHE_TTL
+        and request.args.get("nocache") != "1"
+    ):
         return Response(
-            body,
-            status=405,
+            _patients_cache[1],
+            status=200,
             headers={"Content-Type": "application/json"}
         )
+
+    from src.services.patient.patient_service import json_default, stream_all_patients
     try:
-        patients = get_all_patients()
-        body = json.dumps({
-            "success": True,
-            "patients": patients,
-            "total": len(patients)
-        })
+        # Se obtiene el primer paciente antes de responder para que los errores
+        # de Firestore sigan devolviendo 500 en lugar de un cuerpo truncado
+        patients = stream_all_patients()
+        first = next(patients, None)
+        if first is not None:
+            patients = itertools.chain((first,), patients)
         return Response(
-            body,
+            _stream_patients_body(patients, now, json_default),
             status=200,
             headers={"Content-Type": "application/json"}
         )
     except Exception as e:
-        body = json.dumps({
+        body = orjson.dumps({
             "success": False,
             "error": str(e)
         })
@@ -126,6 +152,7 @@ def listar_todos_pacientes(request: Request) -> Response:
         )
 
 @https_fn.on_request()
+@require_method("POST")
 def update_patient(request: Request) -> Response:
     """Update patient information.
     This function updates patient information in the Firestore database.
@@ -134,19 +161,10 @@ def update_patient(request: Request) -> Response:
     Returns:
         A HTTP response indicating the result of the operation.
     """
-    if request.method != 'POST':
-        body = json.dumps({
-            "success": False,
-            "error": "Invalid HTTP method. Only POST requests are allowed."
-        })
-        return Response(
-            body,
-            status=405,
-            headers={"Content-Type": "application/json"}
-        )
+    from src.services.patient.patient_service import update_patient_information
     return update_patient_information(request)
 
-@https_fn.on_request()
+@https_fn.on_request(**_HOT_ENDPOINT_OPTIONS)
 def paciente_info(request: Request) -> Response:
     """Obtener información del paciente.
     Esta función obtiene la información del paciente desde Firestore.
@@ -156,6 +174,7 @@ def paciente_info(request: Request) -> Response:
     Returns:
         A HTTP response indicating the result of the operation.
     """
+    from src.services.patient.patient_service import get_patient_information
     return get_patient_information(request)
 
 @https_fn.on_request()
@@ -168,6 +187,7 @@ def ficha_medica_info(request: Request) -> Response:
     Returns:
         A HTTP response indicating the result of the operation.
     """
+    from src.services.patient.patient_service import get_medical_record_information
     return get_medical_record_information(request)
 
 @https_fn.on_request()
@@ -180,9 +200,24 @@ def sigsa_info(request: Request) -> Response:
     Returns:
         A HTTP response indicating the result of the operation.
     """
+    from src.services.patient.patient_service import get_sigsa_information
     return get_sigsa_information(request)
 
 @https_fn.on_request()
+def paciente_info_completa(request: Request) -> Response:
+    """Obtener paciente, SIGSA y ficha médica en una sola llamada.
+    Esta función lee los tres documentos del paciente desde Firestore con una
+    única lectura por lotes, en lugar de llamar a los tres endpoints por separado.
+    Args:
+        request: The HTTP request object in JSON format.
+
+    Returns:
+        A HTTP response indicating the result of the operation.
+    """
+    from src.services.patient.patient_service import get_combined_information
+    return get_combined_information(request)
+
+@https_fn.on_request(**_COLD_ENDPOINT_OPTIONS)
 def crear_cita_consultorio(request: Request) -> Response:
     """Crear una nueva cita en el consultorio.
     Esta función crea una nueva cita en el calendario de Google y almacena
@@ -193,6 +228,7 @@ def crear_cita_consultorio(request: Request) -> Response:
     Returns:
         A HTTP response indicating the result of the operation.
     """
+    from src.services.appointment.citas_consultorio import crear_cita
     
     return crear_cita(request)
 
@@ -207,6 +243,7 @@ def actualizar_cita_consultorio(request: Request) -> Response:
     Returns:
         A HTTP response indicating the result of the operation.
     """
+    from src.services.appointment.citas_consultorio import actualizar_cita
     return actualizar_cita(request)
 
 @https_fn.on_request()
@@ -220,6 +257,7 @@ def eliminar_cita_consultorio(request: Request) -> Response:
     Returns:
         A HTTP response indicating the result of the operation.
     """
+    from src.services.appointment.citas_consultorio import eliminar_cita
     return eliminar_cita(request)
 
 @https_fn.on_request()
@@ -232,11 +270,26 @@ def listar_citas_consultorio(request: Request) -> Response:
     Returns:
         A HTTP response indicating the result of the operation.
     """
+    from src.services.appointment.citas_consultorio import listar_citas
     return listar_citas(request)
 
 @https_fn.on_request()
+def listar_citas_combinadas_consultorio(request: Request) -> Response:
+    """Listar citas de Google Calendar y de Firestore en una sola petición.
+    Ambas consultas se hacen en paralelo.
+    Args:
+        request: The HTTP request object in JSON format.
+
+    Returns:
+        A HTTP response with both lists under "google" and "firestore".
+    """
+    from src.services.appointment.citas_consultorio import listar_citas_combinadas
+    return listar_citas_combinadas(request)
+
+@https_fn.on_request(**_HOT_ENDPOINT_OPTIONS)
 def chat_agent(request: Request) -> Response:
     """
     Maneja las interacciones con el agente de la clínica psicológica.
     """
+    from src.services.agents.agent_chat_http import chat_agent_http
     return chat_agent_http(request)
@@ -1,19 +1,38 @@
+from dataclasses import dataclass
 from src.modelos.ficha_medica import FichaMedica
 from src.modelos.paciente import Paciente
 from src.modelos.sigsa import Sigsa
-from typing import Optional
+from typing import Any, Optional
 
 
+def _from_snapshot(model: type, snapshot: Any) -> Any:
+    """Crea el modelo con los campos conocidos del documento, o None si no existe."""
+    if snapshot is None or not snapshot.exists:
+        return None
+    data = snapshot.to_dict() or {}
+    return model(**{k: v for k, v in data.items() if k in model.__dataclass_fields__})
+
+
+@dataclass(slots=True)
 class AllInfo:
     """
     Clase que representa toda la información de un paciente.
     """
-    def __init__(
-            self,
-            paciente: Optional[Paciente],
-            ficha_medica: Optional[FichaMedica],
-            sigsa: Optional[Sigsa]
-    ):
-        self.paciente = paciente
-        self.ficha_medica = ficha_medica
-        self.sigsa = sigsa
\ No newline at end of file
+    paciente: Optional[Paciente]
+    ficha_medica: Optional[FichaMedica]
+    sigsa: Optional[Sigsa]
+
+    @classmethod
+    def from_snapshots(cls, paciente: Any, ficha_medica: Any, sigsa: Any) -> "AllInfo":
+        """
+        Construye AllInfo a partir de los snapshots de Firestore de cada documento.
+        Args:
+            paciente: Snapshot del documento en 'pacientes'.
+            ficha_medica: Snapshot del documento en 'fichas_medicas'.
+            sigsa: Snapshot del documento en 'sigsa'.
+        """
+        return cls(
+            paciente=_from_snapshot(Paciente, paciente),
+            ficha_medica=_from_snapshot(FichaMedica, ficha_medica),
+            sigsa=_from_snapshot(Sigsa, sigsa),
+        )
\ No newline at end of file
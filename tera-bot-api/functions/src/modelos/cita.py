@@ -0,0 +1,43 @@
+"""
+Modelos de validación de los cuerpos JSON de los endpoints de citas.
+Pydantic compila el esquema una sola vez y valida el JSON crudo en una pasada.
+"""
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+class _CitaPayload(BaseModel):
+    # Cadenas vacías cuentan como campos faltantes, igual que la validación anterior
+    model_config = ConfigDict(str_min_length=1)
+
+    nombre_evento: str
+    descripcion_evento: str
+    asistentes: list[str] = []
+
+    @field_validator("asistentes", mode="before")
+    @classmethod
+    def _normalizar_asistentes(cls, value):
+        # Se acepta un solo correo como cadena o null
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return [value]
+        return value
+
+
+class CrearCitaPayload(_CitaPayload):
+    """
+    Cuerpo de la petición para crear una cita.
+    """
+    uid: str
+    fecha_y_hora_inicio: str
+    fecha_y_hora_fin: str
+    zona_horaria: str = "America/Guatemala"
+
+
+class ActualizarCitaPayload(_CitaPayload):
+    """
+    Cuerpo de la petición para actualizar una cita.
+    """
+    id_evento: str
+    fecha_inicio: str
+    fecha_fin: str
@@ -0,0 +1,11 @@
+from dataclasses import fields
+from typing import Any
+
+
+def model_to_dict(model: Any) -> dict[str, Any]:
+    """
+    Convierte un modelo (dataclass con slots) en un diccionario plano.
+    A diferencia de `dataclasses.asdict`, no copia en profundidad los valores,
+    por lo que las referencias de Firestore se conservan tal cual.
+    """
+    return {f.name: getattr(model, f.name) for f in fields(model)}
@@ -1,35 +1,55 @@
 """
 Agente de IA para Clínica Psicológica con RAG y gestión de historial.
 """
+import functools
 from typing import Any
 from agents import Agent, handoff
 from src.orquestador.agentes.agents.agente_examenes_salud_mental import agente_de_examenes_salud_mental
 from src.orquestador.agentes.agents.agente_de_respuestas_salud_mental import agente_de_respuestas_salud_mental
 from src.orquestador.agentes.agents.agente_salud_mental_coloquial import agente_de_salud_mental_coloquial
 from src.orquestador.agentes.agents.agente_transtornos_salud_mental import agente_de_transtornos_salud_mental
-from src.orquestador.agentes.prompt_system.prompt_agente_principal import PromptAgentePrincipal
+from src.orquestador.agentes.prompt_system.prompt_agente_principal import SYSTEM_PROMPT
 from src.orquestador.chroma_data_base.chroma import get_chroma_service
 import logging
 
 logger = logging.getLogger("openai.agents")
-# Para debug detallado
-logger.setLevel(logging.DEBUG)
-# Para mostrar info y niveles superiores
-logger.setLevel(logging.INFO)
-# Para mostrar advertencias y niveles superiores
+# Para mostrar advertencias y niveles superiores (DEBUG/INFO para más detalle)
 logger.setLevel(logging.WARNING)
 
+MODELO_POR_DEFECTO = "gpt-5-mini"
+
+@functools.lru_cache(maxsize=None)
+def _crear_agente_principal(model: str, prompt: str) -> Agent[Any]:
+    """
+    Construye el agente principal con sus handoffs una sola vez por modelo.
+    Args:
+        model: Modelo de OpenAI a usar
+        prompt: Prompt de sistema del agente principal
+    Returns:
+        Agente principal configurado
+    """
+    agente_examenes = agente_de_examenes_salud_mental()
+    agente_transtornos = agente_de_transtornos_salud_mental()
+    agente_coloquial = agente_de_salud_mental_coloquial()
+    agente_respuestas_salud_mental = agente_de_respuestas_salud_mental()
+    return Agent(
+        name="TerapyBot",
+        model=model,
+        instructions=prompt,
+        handoffs=[agente_respuestas_salud_mental, handoff(agente_coloquial), handoff(agente_transtornos), handoff(agente_examenes)],
+    )
+
 class PsychologyClinicAgent:
     """
     Agente de IA especializado para clínica psicológica.
     Integra RAG con ChromaDB y manejo de historial de conversaciones.
     """
 
-    SYSTEM_PROMPT = PromptAgentePrincipal.SYSTEM_PROMPT.value
+    SYSTEM_PROMPT = SYSTEM_PROMPT
 
     def __init__(
         self,
-        model: str = "gpt-5-mini",
+        model: str = MODELO_POR_DEFECTO,
     ):
         """
         Inicializa el agente de la clínica psicológica.
@@ -42,6 +62,9 @@ class PsychologyClinicAgent:
         # Inicializar RAG con ChromaDB
         self.chroma = get_chroma_service()
 
+        # El grafo de agentes no depende del usuario, se reutiliza entre peticiones
+        self._agent = _crear_agente_principal(model, self.SYSTEM_PROMPT)
+
     async def agentPsychology(
         self,
         user_id: str,
@@ -60,24 +83,11 @@ class PsychologyClinicAgent:
             Respuesta del asistente
         """
         try:
-            logging.info(f"Procesando mensaje para usuario: {user_id}")
-            logging.debug(f"Mensaje del usuario: {user_message}")
-            # Obtenemos el prompt del agente principal
-            prompt = self.SYSTEM_PROMPT
-
-            agente_examenes = agente_de_examenes_salud_mental()
-            agente_transtornos = agente_de_transtornos_salud_mental()
-            agente_coloquial = agente_de_salud_mental_coloquial()
-            agente_respuestas_salud_mental = agente_de_respuestas_salud_mental()
-            # Generar respuesta con OpenAI
-            agent = Agent(
-                name="TerapyBot",
-                model=self.model,
-                instructions=prompt,
-                handoffs=[agente_respuestas_salud_mental, handoff(agente_coloquial), handoff(agente_transtornos), handoff(agente_examenes)],
-            )
+            logging.info("Procesando mensaje para usuario: %s", user_id)
+            logging.debug("Mensaje del usuario: %s", user_message)
+            agent = self._agent
 
-            logger.info(f"User ({user_id}): {user_message}")
+            logger.info("User (%s): %s", user_id, user_message)
             return agent
 
         except Exception as e:
@@ -85,3 +95,8 @@ class PsychologyClinicAgent:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
+
+# Los agentes no dependen del usuario ni abren conexiones al construirse, así que
+# el grafo del modelo por defecto se arma al importar el módulo y la primera
+# petición lo encuentra listo.
+_crear_agente_principal(MODELO_POR_DEFECTO, PsychologyClinicAgent.SYSTEM_PROMPT)
@@ -1,11 +1,10 @@
+import functools
 import logging
 from agents import Agent, function_tool
 
 from src.orquestador.chroma_data_base.chroma import get_chroma_service
 from src.types.enums import ChromaCollections
 
-chroma_service = get_chroma_service()
-
 @function_tool(name_override="buscar_conocimiento_con_RAG", description_override="Busca información relevante en la base de conocimientos.")
 def buscar_conocimiento_con_RAG(
         query: str,
@@ -19,13 +18,13 @@ def buscar_conocimiento_con_RAG(
     """
     
     # Busca en el vector store
-    results = chroma_service.query(
+    results = get_chroma_service().query(
         name_collection=ChromaCollections.EXAMENES_DE_SALUD_MENTAL.value,
         query_texts=[query],
         n_results=3,
     )
 
-    logging.info(f"RAG results: {results}")
+    logging.debug("RAG results: %r", results)
     
     # Retorna el contexto encontrado
     if results['documents']:
@@ -33,6 +32,7 @@ def buscar_conocimiento_con_RAG(
         return f"Información encontrada:\n{context}"
     return "No se encontró información relevante."
 
+@functools.lru_cache(maxsize=1)
 def agente_de_examenes_salud_mental() -> Agent:
     """
     Crea un agente que utiliza RAG para obtener contexto relevante de la base de conocimientos.
@@ -44,7 +44,7 @@ def agente_de_examenes_salud_mental() -> Agent:
     Returns:
         Agente configurado con RAG
     """
-    logging.warn("Creando agente de exámenes de salud mental con RAG")
+    logging.warning("Creando agente de exámenes de salud mental con RAG")
     return Agent(
         name="AgenteDeExamenesDeSaludMental",
         instructions="""Eres un agente que proporciona respuestas sobre exámenes de salud mental.
@@ -1,11 +1,12 @@
-from enum import Enum
+"""
+Prompt de sistema del agente principal de la clínica psicológica.
+"""
+import sys
+from typing import Final
 from agents.extensions.handoff_prompt import RECOMMENDED_PROMPT_PREFIX
 
-class PromptAgentePrincipal(Enum):
-    """
-    Enum para el prompt del agente principal de la clínica psicológica.
-    """
-    SYSTEM_PROMPT = f"""{RECOMMENDED_PROMPT_PREFIX}
+# Se recorta y se interna una sola vez al importar: todos los agentes comparten el mismo objeto
+SYSTEM_PROMPT: Final[str] = sys.intern(f"""{RECOMMENDED_PROMPT_PREFIX}
 # IDENTITY & ROLE
 You are TerapyBot, a specialized virtual assistant for a psychology clinic in Santa María Chiquimula, Totonicapán, Guatemala. You serve as a supportive first point of contact for patients seeking mental health support.
 
@@ -58,4 +59,4 @@ Respond with: "I'm concerned about what you're sharing. This situation requires
 5. Always end with an open invitation for further questions
 
 Remember: Your goal is to provide compassionate support while ensuring patients receive appropriate professional care when needed.
-"""
\ No newline at end of file
+""".strip())
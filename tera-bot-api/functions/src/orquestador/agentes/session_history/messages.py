@@ -1,8 +1,32 @@
 
 from dataclasses import dataclass
+import functools
 import logging
+import os
+import sqlite3
+import tempfile
 from agents import SQLiteSession
 
+
+@functools.lru_cache(maxsize=1)
+def _conversations_db_path() -> str:
+    """
+    Ruta de la base de historial en el directorio temporal (el único escribible
+    en Cloud Functions, respaldado en memoria). El modo WAL queda guardado en el
+    archivo, así que basta con activarlo una vez por contenedor.
+    """
+    path = os.path.join(tempfile.gettempdir(), "conversations.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+    return path
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_session(session_id: str) -> SQLiteSession:
+    """Reutiliza la sesión de cada usuario entre turnos de la conversación."""
+    return SQLiteSession(session_id, _conversations_db_path())
+
+
 @dataclass
 class Message:
     """
@@ -19,4 +43,4 @@ class Message:
         """
         logging.warn(f"Creando sesión de historial para usuario: {user_id}")
         session_id = f"session_{user_id}"
-        return SQLiteSession(session_id, "conversations.db")
\ No newline at end of file
+        return _get_session(session_id)
\ No newline at end of file
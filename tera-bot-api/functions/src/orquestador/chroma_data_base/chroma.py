@@ -1,8 +1,9 @@
 from __future__ import annotations
+import functools
 import logging
 import os
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import chromadb
 from chromadb.utils import embedding_functions
 from chromadb.api.types import (
@@ -16,9 +17,11 @@ load_dotenv()
 @dataclass
 class ChromaConfig:
     """Configuración para ChromaDB y embeddings."""
-    # Configuración de ChromaDB
-    database: str = os.getenv("CHROMA_DATABASE_NAME", "Development")
+    # Configuración de ChromaDB (se lee del entorno una sola vez, al importar)
+    database: Optional[str] = os.getenv("CHROMA_DATABASE_NAME")
     path: str = os.getenv("CHROMA_PATH", "Development")
+    api_key: Optional[str] = os.getenv("CHROMA_API_KEY")
+    tenant_id: Optional[str] = os.getenv("CHROMA_TENANT_ID")
 
     # Configuración de embeddings
     openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -36,13 +39,16 @@ class ChromaService:
         self.cfg = cfg or ChromaConfig()
         self._validate_cfg()
         self._client = None
+        self._embedder = None
+        # Colecciones memorizadas por (nombre, modelo de embeddings)
+        self._collections: Dict[Tuple[str, str], chromadb.Collection] = {}
 
     def _validate_cfg(self) -> None:
         """ 
         Valida la configuración necesaria.
         """
-        if not self.cfg.database:
-            raise ValueError("CHROMA_DATABASE no configurada.")
+        if not self.cfg.api_key or not self.cfg.tenant_id or not self.cfg.database:
+            raise ValueError("CHROMA_API_KEY, CHROMA_TENANT_ID o CHROMA_DATABASE_NAME no configuradas.")
 
     @property
     def client(self):
@@ -50,23 +56,24 @@ class ChromaService:
             self._client = self._create_client()
         return self._client
 
+    @property
+    def embedder(self) -> embedding_functions.EmbeddingFunction:
+        if self._embedder is None:
+            self._embedder = self._create_embedder()
+        return self._embedder
+
     def _create_client(self):
         """
         Crea un cliente ChromaDB persistente.
         """
 
-        # Parámetros de conexión
+        # Parámetros de conexión ya validados en _validate_cfg
         try:
-            api_key = os.getenv("CHROMA_API_KEY")
-            tenant_id = os.getenv("CHROMA_TENANT_ID")
-            database_name = os.getenv("CHROMA_DATABASE_NAME")
-            if not api_key or not tenant_id or not database_name:
-                raise ValueError("CHROMA_API_KEY, CHROMA_TENANT_ID o CHROMA_DATABASE_NAME no configuradas.")
             # Creamos un cliente persistente para bases de datos locales
             return chromadb.CloudClient(
-                api_key=api_key,
-                tenant=tenant_id,
-                database=database_name
+                api_key=self.cfg.api_key,
+                tenant=self.cfg.tenant_id,
+                database=self.cfg.database
             )
         except Exception as e:
             logging.error(f"Error creando ChromaDB client: {e}")
@@ -82,7 +89,7 @@ class ChromaService:
             logging.info(f"Using OpenAI model: {self.cfg.openai_model}")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY no configurada y EMBEDDINGS_PROVIDER=openai.")
-            return embedding_functions.OpenAIEmbeddingFunction(api_key=api_key, model_name="text-embedding-3-small")
+            return embedding_functions.OpenAIEmbeddingFunction(api_key=api_key, model_name=self.cfg.openai_model)
         except Exception as e:
             logging.error(f"Error creando OpenAIEmbedder: {e}")
             raise
@@ -90,16 +97,21 @@ class ChromaService:
     def _get_or_create_collection(self, name: str) -> chromadb.Collection:
         """
         Obtiene o crea una colección en ChromaDB.
+        La colección se memoriza por nombre y modelo de embeddings para reutilizar
+        cliente y embedder entre consultas.
         Args:
             name: Nombre de la colección.
         Returns:
             La colección de ChromaDB.
         """
-        client = self._create_client()
-        embedding_function = self._create_embedder()
-        collection = client.get_or_create_collection(
+        key = (name, self.cfg.openai_model)
+        collection = self._collections.get(key)
+        if collection is not None:
+            return collection
+
+        collection = self.client.get_or_create_collection(
             name=name,
-            embedding_function=embedding_function,
+            embedding_function=self.embedder,
             configuration={
                 "hnsw": {
                     "space": "cosine",
@@ -108,6 +120,7 @@ class ChromaService:
             }
         )
         logging.info(f"ChromaService: Usando colección '{name}' en base '{self.cfg.database}'")
+        self._collections[key] = collection
         return collection
 
     def add_texts(
@@ -158,6 +171,7 @@ class ChromaService:
         name_collection: str,
         query_texts: List[str],
         n_results: int = 5,
+        include: Sequence[str] = ("documents",),
     ) -> Any:
         """
         Consulta la base de conocimientos en una colección específica.
@@ -165,22 +179,22 @@ class ChromaService:
             name_collection: Nombre de la colección.
             query_texts: Lista de textos de consulta.
             n_results: Número de resultados a retornar por consulta.
+            include: Campos a devolver ("documents", "metadatas", "distances").
+                Por defecto solo documentos para no transferir lo que no se usa.
         Returns:
-            Resultados de la consulta incluyendo documentos, metadatos y distancias.
+            Resultados de la consulta con los campos pedidos en `include`.
         """
         collection = self._get_or_create_collection(name_collection)
         results = collection.query(
             query_texts=query_texts,
             n_results=n_results,
-            include=["documents", "metadatas", "distances"]
+            include=list(include)
         )
         documents = results.get('documents', []) if results else []
         if not documents:
             logging.warning(f"ChromaService: Sin resultados en '{name_collection}' para {len(query_texts)} textos")
 
-        logging.info(f"ChromaService: Resultados de consulta: {results}")
-
-        logging.info(f"ChromaService: Consulta en '{name_collection}' con {len(query_texts)} textos, resultados obtenidos {results}")
+        logging.debug("ChromaService: Consulta en '%s' con %d textos", name_collection, len(query_texts))
         return results
 
     def reset_collection(self, name_collection: str) -> None:
@@ -192,10 +206,13 @@ class ChromaService:
         """
         # elimina la colección y la crea de nuevo con la misma config
         self.client.delete_collection(name_collection)
+        self._collections.pop((name_collection, self.cfg.openai_model), None)
         self.collection = self._get_or_create_collection(name_collection)
 
 
 # Fábrica rápida si solo quieres el cliente/colección listos
+# Se comparte una única instancia por proceso (cliente, embedder y colecciones)
+@functools.lru_cache(maxsize=1)
 def get_chroma_service() -> ChromaService:
     cfg = ChromaConfig()
     return ChromaService(cfg)
@@ -1,10 +1,18 @@
+import functools
 import logging
-from typing import Dict
+from typing import AsyncIterator, Dict
 from agents import Runner, SQLiteSession, TResponseInputItem
+from openai.types.responses import ResponseTextDeltaEvent
 from src.orquestador.agentes.agente_principal import PsychologyClinicAgent
 from src.orquestador.agentes.session_history.messages import Message
 
 
+@functools.lru_cache(maxsize=1)
+def _get_psychology_agent() -> PsychologyClinicAgent:
+    """El agente no guarda estado por usuario, así que se comparte entre peticiones."""
+    return PsychologyClinicAgent()
+
+
 class Orquestador:
     """
     Orquestador principal que maneja la interacción entre el usuario y los agentes.
@@ -25,22 +33,18 @@ class Orquestador:
         ) -> None:
         self.user_id = user_id
         self.message = message
-        self.history = None
+        self.history = self._create_history_session(user_id)
 
-    async def generate_response(self) -> Dict[str, str | list[TResponseInputItem]]:
+    async def generate_response(self, include_history: bool = False) -> Dict[str, str | list[TResponseInputItem]]:
         """
         Procesa la interacción del usuario y genera una respuesta.
+        Args:
+            include_history: Si es True, lee y devuelve todo el historial de la
+                conversación; por defecto se omite para no sumar una lectura de
+                SQLite a cada turno.
         """
         try:
-            if self.history is None:
-                logging.info(f"No hay historial previo para usuario: {self.user_id}. Creando nuevo historial.")
-                self.history = self._create_history_session(self.user_id)
-
-            history = self.history
-            logging.warn(f"Sesión de historial creada para usuario: {self.user_id}")
-
-            psychologyClinicAgent = PsychologyClinicAgent()
-            agent = await psychologyClinicAgent.agentPsychology(
+            agent = await _get_psychology_agent().agentPsychology(
                 user_id=self.user_id,
                 user_message=self.message,
             )
@@ -51,10 +55,16 @@ class Orquestador:
                 self.message,
                 session=self.history,
             )
-            logging.warn(f"TerapyBot: {result}")
-            logging.warn(f"Result Session: {self.history}")
+            logging.debug("TerapyBot: %s", result)
+            logging.debug("Result Session: %s", self.history)
+            if not include_history:
+                return {
+                    "respuesta": result.final_output,
+                    "historial": [],
+                }
+
             history = await self._get_all_history(self.user_id)
-            logging.warn(f"Historial de mensajes para usuario {self.user_id}: {history}")
+            logging.debug("Historial de mensajes para usuario %s: %d mensajes", self.user_id, len(history))
 
             return {
                 "respuesta": result.final_output,
@@ -65,6 +75,24 @@ class Orquestador:
             logging.error(f"Orquestador: Error procesando interacción para {self.user_id}: {e}")
             return {"error": f"Error procesando la solicitud: {e}"}
 
+    async def stream_response(self) -> AsyncIterator[str]:
+        """
+        Genera la respuesta del agente en fragmentos de texto a medida que el
+        modelo los produce. El SDK guarda el turno en el historial al terminar.
+        """
+        agent = await _get_psychology_agent().agentPsychology(
+            user_id=self.user_id,
+            user_message=self.message,
+        )
+        result = Runner.run_streamed(
+            agent,
+            self.message,
+            session=self.history,
+        )
+        async for event in result.stream_events():
+            if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+                yield event.data.delta
+
     def _create_history_session(self, user_id: str) -> SQLiteSession:
         """
         Crea un session_id único por usuario.
@@ -88,10 +116,6 @@ class Orquestador:
             user_id: ID único del usuario
         """
         logging.info(f"Obteniendo historial de mensajes para usuario: {user_id}")
-        if self.history is None:
-            logging.info(f"No hay historial previo para usuario: {user_id}. Creando nuevo historial.")
-            return []
-
         conversations = await self.history.get_items()
-        logging.warn(f"Historial obtenido para usuario {user_id}: {conversations}")
+        logging.debug("Historial obtenido para usuario %s: %d mensajes", user_id, len(conversations))
         return conversations
\ No newline at end of file
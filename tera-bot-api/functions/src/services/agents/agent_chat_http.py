@@ -1,6 +1,11 @@
 import asyncio
+import concurrent.futures
+import functools
 import logging
-import json
+import queue
+import threading
+
+import orjson
 
 from flask import Request, Response
 from src.orquestador.orquestador import Orquestador
@@ -8,28 +13,86 @@ from src.orquestador.orquestador import Orquestador
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tiempo máximo de espera por respuesta del agente (timeout por defecto de Cloud Functions)
+_RESPONSE_TIMEOUT = 60
+
+
+@functools.lru_cache(maxsize=1)
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop persistente en un hilo de fondo, compartido por todas las peticiones.
+    Evita crear y destruir un loop por petición (asyncio.run) y mantiene vivas las
+    conexiones HTTP del cliente de OpenAI entre turnos. Usa uvloop si está disponible.
+    """
+    try:
+        import uvloop
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="chat-agent-loop", daemon=True).start()
+    return loop
+
+_FIN_STREAM = object()
+
+
+def _stream_chat(orquestador: Orquestador):
+    """
+    Reenvía como eventos SSE los fragmentos que el agente produce en el loop de
+    fondo. Si el cliente se desconecta, el generador se cierra y se cancela el turno.
+    """
+    fragmentos: queue.Queue = queue.Queue()
+
+    async def _consumir():
+        try:
+            async for delta in orquestador.stream_response():
+                fragmentos.put(delta)
+        except Exception as e:
+            fragmentos.put(e)
+        finally:
+            fragmentos.put(_FIN_STREAM)
+
+    future = asyncio.run_coroutine_threadsafe(_consumir(), _get_event_loop())
+    try:
+        while True:
+            try:
+                item = fragmentos.get(timeout=_RESPONSE_TIMEOUT)
+            except queue.Empty:
+                item = TimeoutError("El agente no respondió a tiempo.")
+            if item is _FIN_STREAM:
+                yield b"event: done\ndata: {}\n\n"
+                return
+            if isinstance(item, Exception):
+                logging.error("Error en generar la respuesta: %s", item)
+                yield b"event: error\ndata: " + orjson.dumps({"error": str(item)}) + b"\n\n"
+                return
+            yield b"data: " + orjson.dumps({"delta": item}) + b"\n\n"
+    finally:
+        future.cancel()
+
 def chat_agent_http(request: Request) -> Response:
     """
     Endpoint HTTP para manejar interacciones con el agente de la clínica psicológica.
     Espera solicitudes POST con un cuerpo JSON que contenga 'messages' y 'user_id'.
-    Devuelve respuestas generadas por el agente y el historial de la conversación.
+    Devuelve respuestas generadas por el agente; el historial de la conversación
+    solo se incluye con el parámetro `?include_history=1`. Con `?stream=1` la
+    respuesta se envía como Server-Sent Events a medida que se genera.
     """
 
     if request.method != 'POST':
-        body = json.dumps({
+        body = orjson.dumps({
             "success": False,
             "error": "Método no permitido. Solo se permiten solicitudes POST."
         })
         return Response(
             body,
             status=405,
-            headers={"Content-Type": "application/json"}
+            headers={"Content-Type": "application/json; charset=utf-8"}
         )
      
     request_json = request.get_json(silent=True)
 
     if not request_json:
-        body = json.dumps({
+        body = orjson.dumps({
             "success": False,
             "error": "Petición inválida: No se encontró el cuerpo JSON"
         })
@@ -37,14 +100,14 @@ def chat_agent_http(request: Request) -> Response:
         return Response(
             body,
             status=400,
-            headers={"Content-Type": "application/json"}
+            headers={"Content-Type": "application/json; charset=utf-8"}
         )
 
     messages = request_json.get('messages')
     user_id = request_json.get('user_id')
 
     if not messages or not user_id:
-        body = json.dumps({
+        body = orjson.dumps({
             "success": False,
             "error": "Petición inválida: Faltan campos requeridos 'messages' o 'user_id'"
         })
@@ -52,7 +115,7 @@ def chat_agent_http(request: Request) -> Response:
         return Response(
             body,
             status=400,
-            headers={"Content-Type": "application/json"}
+            headers={"Content-Type": "application/json; charset=utf-8"}
         )
 
     try:
@@ -60,9 +123,25 @@ def chat_agent_http(request: Request) -> Response:
             user_id=user_id,
             message=messages,
         )
-        
-        result = asyncio.run(orquestador.generate_response())
-        body = json.dumps({
+
+        if request.args.get("stream") == "1":
+            return Response(
+                _stream_chat(orquestador),
+                status=200,
+                headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"},
+            )
+
+        include_history = request.args.get("include_history") == "1"
+        future = asyncio.run_coroutine_threadsafe(
+            orquestador.generate_response(include_history=include_history),
+            _get_event_loop(),
+        )
+        try:
+            result = future.result(timeout=_RESPONSE_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError("El agente no respondió a tiempo.")
+        body = orjson.dumps({
             "success": True,
             "respuesta_asistente": result["respuesta"],
             "historial": result["historial"]
@@ -70,10 +149,10 @@ def chat_agent_http(request: Request) -> Response:
         return Response(
             body,
             status=200,
-            headers={"Content-Type": "application/json"},
+            headers={"Content-Type": "application/json; charset=utf-8"},
         )
     except Exception as e:
-        body = json.dumps({
+        body = orjson.dumps({
             "success": False,
             "error": str(e)
         })
@@ -81,5 +160,5 @@ def chat_agent_http(request: Request) -> Response:
         return Response(
             body,
             status=500,
-            headers={"Content-Type": "application/json"},
+            headers={"Content-Type": "application/json; charset=utf-8"},
         )
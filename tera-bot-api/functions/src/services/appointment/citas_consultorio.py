@@ -1,11 +1,18 @@
 import datetime
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
-import json
+import orjson
 from firebase_admin import firestore
 from flask import Request, Response
+from pydantic import ValidationError
+
+from src.modelos.cita import ActualizarCitaPayload, CrearCitaPayload
 
 from src.services.appointment.google_calendar import AdministradorCalendarioGoogle
+from src.services.firebase.firestore_client import get_firestore_client
 
 def _json_response(payload: Dict[str, Any], status: int = 200) -> Response:
     """
@@ -13,12 +20,17 @@ def _json_response(payload: Dict[str, Any], status: int = 200) -> Response:
     Maneja automáticamente tipos de Firestore como DatetimeWithNanoseconds.
     """
     try:
-        # Usar default=str para manejar tipos no serializables
-        json_str = json.dumps(payload, default=str, ensure_ascii=False)
-        logging.info(f"Response: {json_str}")
+        # orjson no reconoce subclases de datetime (DatetimeWithNanoseconds):
+        # default=str las serializa igual que antes
+        json_bytes = orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC,
+        )
+        logging.debug("Response len=%d status=%d", len(json_bytes), status)
         
         return Response(
-            json_str,
+            json_bytes,
             status=status,
             headers={
                 "Content-Type": "application/json; charset=utf-8"
@@ -32,7 +44,7 @@ def _json_response(payload: Dict[str, Any], status: int = 200) -> Response:
             "error": "Error interno del servidor al serializar respuesta"
         }
         return Response(
-            json.dumps(error_response),
+            orjson.dumps(error_response),
             status=500,
             headers={"Content-Type": "application/json; charset=utf-8"},
         )
@@ -41,6 +53,11 @@ def _bad_request(msg: str) -> Response:
     return _json_response({"success": False, "error": msg}, status=400)
 
 
+def _invalid_payload(error: ValidationError) -> Response:
+    campos = ", ".join(".".join(map(str, e["loc"])) or "body" for e in error.errors())
+    return _bad_request(f"Faltan campos requeridos o son inválidos: {campos}")
+
+
 def _method_not_allowed() -> Response:
     return _json_response(
         {"success": False, "error": "Invalid HTTP method. Only POST requests are allowed."},
@@ -51,35 +68,67 @@ def _method_not_allowed() -> Response:
 # Utilizada para almacenar y gestionar las citas localmente
 # Usamos el patrón Singleton para la conexión a Firestore
 class FirestoreCitasRepository:
-    def __init__(self, collection_name: str = "citas"):
-        self._col = firestore.client().collection(collection_name)
+    def __init__(
+        self,
+        collection_name: str = "citas",
+        client: Optional[firestore.firestore.Client] = None,
+    ):
+        # Por defecto usa el cliente (y su canal gRPC) compartido del contenedor
+        self._client = client or get_firestore_client()
+        self._col = self._client.collection(collection_name)
         self._collection_name = collection_name
 
-    def guardar_evento(self, id_evento: str, data: dict) -> dict:
+    # El evento crudo de Google Calendar vive en citas/{id}/raw/google para que
+    # el documento principal (el que leen los listados) quede pequeño.
+    def _raw_google_ref(self, id_evento: str):
+        return self._col.document(id_evento).collection("raw").document("google")
+
+    def _set_con_raw(self, id_evento: str, data: dict, raw_google_event: Optional[dict]) -> None:
+        # Documento principal y evento crudo en un solo commit (un RPC)
+        batch = self._client.batch()
+        batch.set(self._col.document(id_evento), data, merge=True)
+        if raw_google_event is not None:
+            batch.set(self._raw_google_ref(id_evento), raw_google_event)
+        batch.commit()
+
+    # Con skip_readback=True se evita el segundo RPC (get) tras escribir y se
+    # devuelven los datos escritos con la hora del cliente en lugar de la del servidor.
+    # `data` se modifica en el lugar (sin copias): los llamadores pasan un dict
+    # recién construido y reciben en él los timestamps y el id.
+    def guardar_evento(
+        self,
+        id_evento: str,
+        data: dict,
+        skip_readback: bool = True,
+        raw_google_event: Optional[dict] = None,
+    ) -> dict:
         logging.info(f"[Firestore] Guardando evento id={id_evento} en {self._collection_name}")
-        data = {
-            **data,
-            "actualizado_en": firestore.firestore.SERVER_TIMESTAMP,
-        }
+        data["actualizado_en"] = firestore.firestore.SERVER_TIMESTAMP
+        data["fecha_creacion"] = firestore.firestore.SERVER_TIMESTAMP
         logging.info(f"[Firestore] Datos a guardar: {data}")
         # Creamos el doc con id_evento (mantenemos mismo id que Google Calendar)
-        self._col.document(id_evento).set(
-            {
-                **data,
-                "fecha_creacion": firestore.firestore.SERVER_TIMESTAMP,
-            },
-            merge=True,
-        )
+        self._set_con_raw(id_evento, data, raw_google_event)
+        if skip_readback:
+            data["actualizado_en"] = data["fecha_creacion"] = datetime.datetime.now(datetime.timezone.utc)
+            data["id"] = id_evento
+            return data
         doc = self._col.document(id_evento).get()
         return {"id": doc.id, **(doc.to_dict() or {})}
 
-    def actualizar_evento(self, id_evento: str, data: dict) -> dict:
+    def actualizar_evento(
+        self,
+        id_evento: str,
+        data: dict,
+        skip_readback: bool = True,
+        raw_google_event: Optional[dict] = None,
+    ) -> dict:
         logging.info(f"[Firestore] Actualizando evento id={id_evento} en {self._collection_name}")
-        data = {
-            **data,
-            "actualizado_en": firestore.firestore.SERVER_TIMESTAMP,
-        }
-        self._col.document(id_evento).set(data, merge=True)
+        data["actualizado_en"] = firestore.firestore.SERVER_TIMESTAMP
+        self._set_con_raw(id_evento, data, raw_google_event)
+        if skip_readback:
+            data["actualizado_en"] = datetime.datetime.now(datetime.timezone.utc)
+            data["id"] = id_evento
+            return data
         doc = self._col.document(id_evento).get()
         if not doc.exists:
             raise ValueError("El evento no existe en Firestore.")
@@ -87,7 +136,17 @@ class FirestoreCitasRepository:
 
     def eliminar_evento(self, id_evento: str) -> None:
         logging.info(f"[Firestore] Eliminando evento id={id_evento} en {self._collection_name}")
-        self._col.document(id_evento).delete()
+        # Borrar el documento no borra sus subcolecciones
+        batch = self._client.batch()
+        batch.delete(self._raw_google_ref(id_evento))
+        batch.delete(self._col.document(id_evento))
+        batch.commit()
+
+    def obtener_raw_google_event(self, id_evento: str) -> Optional[dict]:
+        doc = self._raw_google_ref(id_evento).get()
+        if not doc.exists:
+            return None
+        return doc.to_dict()
 
     def obtener_evento(self, id_evento: str) -> Optional[dict]:
         doc = self._col.document(id_evento).get()
@@ -95,15 +154,86 @@ class FirestoreCitasRepository:
             return None
         return {"id": doc.id, **(doc.to_dict() or {})}
 
-    def listar_eventos(self, limit: int = 100, id_paciente: Optional[str] = None) -> List[dict]:
+    def listar_eventos(
+        self,
+        limit: int = 100,
+        id_paciente: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[dict]:
+        """
+        Lista eventos ordenados por fecha de inicio.
+        Si se indica `fields`, Firestore devuelve solo esos campos de cada documento;
+        para el documento completo usar obtener_evento.
+        """
         logging.info(f"[Firestore] Listando eventos (limit={limit}, id_paciente={id_paciente})")
-        query = self._col.order_by("fecha_inicio").limit(limit)
+        # Con filtro por paciente usa el índice compuesto (id_paciente, fecha_inicio)
+        # declarado en firestore.indexes.json
+        query = self._col
         if id_paciente:
-            query = self._col.where("id_paciente", "==", id_paciente).order_by("fecha_inicio").limit(limit)
+            query = query.where("id_paciente", "==", id_paciente)
+        query = query.order_by("fecha_inicio").limit(limit)
+        if fields:
+            query = query.select(fields)
 
         docs = query.stream()
         return [{"id": d.id, **(d.to_dict() or {})} for d in docs]
 
+# Pool compartido para lanzar en paralelo las llamadas independientes a Firestore
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="citas-io")
+
+# Campos que devuelven los listados de Firestore. Los documentos anteriores aún
+# guardan el evento crudo de Google Calendar en `raw_google_event`; se excluye.
+_CAMPOS_RESUMEN_CITA = [
+    "id_paciente",
+    "nombre_evento",
+    "descripcion_evento",
+    "fecha_inicio",
+    "fecha_fin",
+    "asistentes",
+    "zona_horaria",
+    "google_event_id",
+    "status",
+    "created_at",
+    "updated_at",
+]
+
+# Caché por contenedor de los listados: clave -> (instante, citas).
+# Las escrituras de citas corren en otros contenedores y no pueden vaciarla, así
+# que una cita creada, actualizada o eliminada puede tardar hasta _LIST_CACHE_TTL
+# segundos en reflejarse en los listados.
+# Las claves salen de los parámetros de la petición: la caché tiene un tamaño
+# máximo y `limit`/`max_resultados` se acotan a _MAX_RESULTADOS antes de armarlas.
+# Los endpoints atienden peticiones concurrentes: todo acceso pasa por el lock.
+_LIST_CACHE_TTL = 30.0
+_LIST_CACHE_MAX = 128
+_MAX_RESULTADOS = 250
+_list_cache: Dict[tuple, tuple[float, List[Dict[str, Any]]]] = {}
+_list_cache_lock = threading.Lock()
+
+
+def _acotar(valor: int) -> int:
+    """Acota un límite de resultados pedido por el cliente a [1, _MAX_RESULTADOS]."""
+    return max(1, min(valor, _MAX_RESULTADOS))
+
+
+def _cached_list(key: tuple, loader) -> List[Dict[str, Any]]:
+    now = time.monotonic()
+    with _list_cache_lock:
+        hit = _list_cache.get(key)
+    if hit is not None and now - hit[0] < _LIST_CACHE_TTL:
+        return hit[1]
+    result = loader()
+    with _list_cache_lock:
+        if len(_list_cache) >= _LIST_CACHE_MAX:
+            # Primero se descartan las vencidas; si no basta, la más antigua
+            # (los dict conservan el orden de inserción)
+            for vencida in [k for k, (t, _) in _list_cache.items() if now - t >= _LIST_CACHE_TTL]:
+                del _list_cache[vencida]
+            if len(_list_cache) >= _LIST_CACHE_MAX:
+                _list_cache.pop(next(iter(_list_cache)), None)
+        _list_cache[key] = (now, result)
+    return result
+
 # Servicio principal que integra Google Calendar y Firestore
 class CitasConsultorioService:
     def __init__(
@@ -114,24 +244,15 @@ class CitasConsultorioService:
         self._repo = repo or FirestoreCitasRepository()
 
     # ------------------------- Integración Google + Firestore -----------------
-    def crear_cita(self, payload: Dict[str, str | list | None]) -> Dict[str, Any]:
+    def crear_cita(self, payload: CrearCitaPayload) -> Dict[str, Any]:
         logging.info("[CitasService] Crear cita - inicio")
-        id_paciente = payload.get("uid")
-        nombre_evento = payload.get("nombre_evento")
-        descripcion_evento = payload.get("descripcion_evento")
-        fecha_inicio = payload.get("fecha_y_hora_inicio")
-        fecha_fin = payload.get("fecha_y_hora_fin")
-        asistentes = payload.get("asistentes", [])
-        zona_horaria = payload.get("zona_horaria", "America/Guatemala")
-
-        if not all([id_paciente, nombre_evento, descripcion_evento, fecha_fin]):
-            raise ValueError("Faltan campos requeridos.")
-
-        if isinstance(asistentes, str):
-            asistentes = [asistentes]
-
-        if not isinstance(nombre_evento, str) or not isinstance(descripcion_evento, str) or not isinstance(fecha_fin, str) or not isinstance(fecha_inicio, str) or not isinstance(zona_horaria, str):
-            raise ValueError("nombre_evento, descripcion_evento, fecha_fin, fecha_inicio y zona_horaria deben ser cadenas de texto.")
+        id_paciente = payload.uid
+        nombre_evento = payload.nombre_evento
+        descripcion_evento = payload.descripcion_evento
+        fecha_inicio = payload.fecha_y_hora_inicio
+        fecha_fin = payload.fecha_y_hora_fin
+        asistentes = payload.asistentes
+        zona_horaria = payload.zona_horaria
 
         logging.info("[CitasService] Creando evento en Google Calendar")
         evento_gc = self._calendar.crear_evento(
@@ -149,6 +270,7 @@ class CitasConsultorioService:
 
         # Persistencia en Firestore
         logging.info("[CitasService] Guardando evento en Firestore")
+        ahora = datetime.datetime.utcnow().isoformat() + "Z"
         data_fs = {
             "id_paciente": id_paciente,
             "nombre_evento": nombre_evento,
@@ -159,33 +281,23 @@ class CitasConsultorioService:
             "zona_horaria": zona_horaria,
             "google_event_id": google_event_id,
             "status": "CONFIRMED",
-            "created_at": datetime.datetime.now().isoformat() + "Z",
-            "updated_at": datetime.datetime.now().isoformat() + "Z",
-            "raw_google_event": evento_gc,
+            "created_at": ahora,
+            "updated_at": ahora,
         }
-        evento_fs = self._repo.guardar_evento(google_event_id, data_fs)
+        evento_fs = self._repo.guardar_evento(google_event_id, data_fs, raw_google_event=evento_gc)
 
         if evento_fs:
             logging.info("CITA CREADA EXITOSAMENTE")
         return data_fs
 
-    def actualizar_cita(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def actualizar_cita(self, payload: ActualizarCitaPayload) -> Dict[str, Any]:
         logging.info("[CitasService] Actualizar cita - inicio")
-        id_evento = payload.get("id_evento")
-        nombre_evento = payload.get("nombre_evento")
-        descripcion_evento = payload.get("descripcion_evento")
-        fecha_inicio = payload.get("fecha_inicio")
-        fecha_fin = payload.get("fecha_fin")
-        asistentes = payload.get("asistentes", [])
-
-        if not all([id_evento, nombre_evento, descripcion_evento, fecha_inicio, fecha_fin]):
-            raise ValueError("Faltan campos requeridos.")
-        
-        if isinstance(asistentes, str):
-            asistentes = [asistentes]
-
-        if not isinstance(id_evento, str):
-            raise ValueError("id_evento debe ser una cadena de texto.")
+        id_evento = payload.id_evento
+        nombre_evento = payload.nombre_evento
+        descripcion_evento = payload.descripcion_evento
+        fecha_inicio = payload.fecha_inicio
+        fecha_fin = payload.fecha_fin
+        asistentes = payload.asistentes
 
         logging.info("[CitasService] Actualizando evento en Google Calendar")
         evento_gc = self._calendar.actualizar_evento(
@@ -206,9 +318,8 @@ class CitasConsultorioService:
             "asistentes": asistentes,
             "status": evento_gc.get("status") or "CONFIRMED",
             "updated_at": datetime.datetime.utcnow().isoformat() + "Z",
-            "raw_google_event": evento_gc,
         }
-        evento_fs = self._repo.actualizar_evento(id_evento, data_fs)
+        evento_fs = self._repo.actualizar_evento(id_evento, data_fs, raw_google_event=evento_gc)
 
         if evento_fs:
             logging.info("CITA ACTUALIZADA EXITOSAMENTE")
@@ -221,38 +332,89 @@ class CitasConsultorioService:
         if not id_evento:
             raise ValueError("Faltan campos requeridos.")
 
-        logging.info("[CitasService] Eliminando evento en Google Calendar")
-        self._calendar.eliminar_evento(evento_id=id_evento)
-
+        # Ambos borrados son independientes: el de Firestore corre en el pool
+        # mientras este hilo espera a Google Calendar.
         logging.info("[CitasService] Eliminando evento en Firestore")
-        self._repo.eliminar_evento(id_evento)
+        borrado_fs = _io_pool.submit(self._repo.eliminar_evento, id_evento)
+
+        logging.info("[CitasService] Eliminando evento en Google Calendar")
+        try:
+            self._calendar.eliminar_evento(evento_id=id_evento)
+        finally:
+            # El borrado de Firestore ya se lanzó: se espera (y se propaga su error)
+            # aunque falle Google Calendar.
+            borrado_fs.result()
 
         logging.info("[CitasService] Eliminar cita - fin")
 
     def listar_citas_google(self, max_resultados: int = 100) -> List[Dict[str, Any]]:
         logging.info("[CitasService] Listar citas (Google Calendar)")
-        citas = self._calendar.lista_eventos_proximos(max_resultados=max_resultados)
+        max_resultados = _acotar(max_resultados)
+        citas = _cached_list(
+            ("google", max_resultados),
+            lambda: self._calendar.lista_eventos_proximos(max_resultados=max_resultados),
+        )
         logging.info(f"[CitasService] Citas encontradas: {len(citas)}")
         return citas
 
+    def listar_citas_combinadas(
+        self,
+        max_resultados: int = 100,
+        limit: int = 100,
+        id_paciente: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        # Las dos consultas son independientes: Firestore corre en el pool
+        # mientras este hilo consulta Google Calendar.
+        logging.info("[CitasService] Listar citas (Google Calendar + Firestore)")
+        citas_fs = _io_pool.submit(self.listar_citas_firestore, limit=limit, id_paciente=id_paciente)
+        citas_google = self.listar_citas_google(max_resultados=max_resultados)
+        return {"google": citas_google, "firestore": citas_fs.result()}
+
     # ------------------------- Solo Firestore ---------------------------------
     def guardar_cita_firestore(self, id_evento: str, data: Dict[str, Any]) -> Dict[str, Any]:
         if not id_evento:
             raise ValueError("id_evento es requerido para guardar en Firestore.")
-        return self._repo.guardar_evento(id_evento, data)
+        return self._repo.guardar_evento(id_evento, data, skip_readback=False)
 
     def actualizar_cita_firestore(self, id_evento: str, data: Dict[str, Any]) -> Dict[str, Any]:
         if not id_evento:
             raise ValueError("id_evento es requerido para actualizar en Firestore.")
-        return self._repo.actualizar_evento(id_evento, data)
+        return self._repo.actualizar_evento(id_evento, data, skip_readback=False)
 
     def eliminar_cita_firestore(self, id_evento: str) -> None:
         if not id_evento:
             raise ValueError("id_evento es requerido para eliminar en Firestore.")
         self._repo.eliminar_evento(id_evento)
 
-    def listar_citas_firestore(self, limit: int = 100, id_paciente: Optional[str] = None) -> List[Dict[str, Any]]:
-        return self._repo.listar_eventos(limit=limit, id_paciente=id_paciente)
+    def listar_citas_firestore(
+        self,
+        limit: int = 100,
+        id_paciente: Optional[str] = None,
+        fields: Optional[List[str]] = _CAMPOS_RESUMEN_CITA,
+    ) -> List[Dict[str, Any]]:
+        limit = _acotar(limit)
+        return _cached_list(
+            ("firestore", limit, id_paciente, tuple(fields) if fields else None),
+            lambda: self._repo.listar_eventos(limit=limit, id_paciente=id_paciente, fields=fields),
+        )
+
+
+_service: Optional[CitasConsultorioService] = None
+_service_lock = threading.Lock()
+
+
+def _get_service() -> CitasConsultorioService:
+    """
+    Devuelve el servicio de citas del contenedor, creándolo la primera vez.
+    Así el calendario de Google y el repositorio de Firestore se autentican una
+    sola vez y no en cada petición.
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = CitasConsultorioService()
+    return _service
 
 
 # Funciones HTTP expuestas
@@ -260,13 +422,17 @@ def crear_cita(request: Request) -> Response:
     if request.method != 'POST':
         return _method_not_allowed()
 
-    request_json = request.get_json(silent=True)
-    if not request_json:
+    body = request.get_data()
+    if not body:
         return _bad_request("Invalid request format. JSON expected.")
+    try:
+        payload = CrearCitaPayload.model_validate_json(body)
+    except ValidationError as e:
+        return _invalid_payload(e)
 
     try:
-        service = CitasConsultorioService()
-        result = service.crear_cita(request_json)
+        service = _get_service()
+        result = service.crear_cita(payload)
         logging.info("Cita creada exitosamente")
         return _json_response({"success": True, "data": result, "message": "Cita creada exitosamente"})
     except Exception as e:
@@ -278,13 +444,17 @@ def actualizar_cita(request: Request) -> Response:
     if request.method != 'POST':
         return _method_not_allowed()
 
-    request_json = request.get_json(silent=True)
-    if not request_json:
+    body = request.get_data()
+    if not body:
         return _bad_request("Invalid request format. JSON expected.")
+    try:
+        payload = ActualizarCitaPayload.model_validate_json(body)
+    except ValidationError as e:
+        return _invalid_payload(e)
 
     try:
-        service = CitasConsultorioService()
-        result = service.actualizar_cita(request_json)
+        service = _get_service()
+        result = service.actualizar_cita(payload)
         return _json_response({"success": True, "data": result, "message": "Cita actualizada exitosamente"})
     except Exception as e:
         logging.exception("Error al actualizar cita")
@@ -293,7 +463,7 @@ def actualizar_cita(request: Request) -> Response:
 
 def listar_citas(request: Request) -> Response:
     if request.method != 'GET':
-        body = json.dumps({
+        body = orjson.dumps({
             "success": False,
             "error": "Invalid HTTP method. Only GET requests are allowed."
         })
@@ -305,7 +475,7 @@ def listar_citas(request: Request) -> Response:
 
     try:
         max_resultados = int(request.args.get("max_resultados", "100")) if request.args else 100
-        service = CitasConsultorioService()
+        service = _get_service()
         eventos = service.listar_citas_google(max_resultados=max_resultados)
         logging.info(f"Citas listadas: {len(eventos)}")
         if len(eventos) == 0:
@@ -316,6 +486,35 @@ def listar_citas(request: Request) -> Response:
         return _json_response({"success": False, "error": str(e)}, status=500)
 
 
+def listar_citas_combinadas(request: Request) -> Response:
+    if request.method != 'GET':
+        body = orjson.dumps({
+            "success": False,
+            "error": "Invalid HTTP method. Only GET requests are allowed."
+        })
+        return Response(
+            body,
+            status=405,
+            headers={"Content-Type": "application/json"}
+        )
+
+    try:
+        args = request.args or {}
+        max_resultados = int(args.get("max_resultados", "100"))
+        limit = int(args.get("limit", "100"))
+        id_paciente = args.get("id_paciente")
+        service = _get_service()
+        citas = service.listar_citas_combinadas(
+            max_resultados=max_resultados,
+            limit=limit,
+            id_paciente=id_paciente,
+        )
+        return _json_response({"success": True, "data": citas, "message": "Citas listadas exitosamente"})
+    except Exception as e:
+        logging.exception("Error al listar citas combinadas")
+        return _json_response({"success": False, "error": str(e)}, status=500)
+
+
 def eliminar_cita(request: Request) -> Response:
     if request.method != 'POST':
         return _method_not_allowed()
@@ -329,7 +528,7 @@ def eliminar_cita(request: Request) -> Response:
         return _bad_request("Faltan campos requeridos.")
 
     try:
-        service = CitasConsultorioService()
+        service = _get_service()
         service.eliminar_cita(id_evento=id_evento)
         return _json_response({"success": True, "message": "Cita eliminada exitosamente"})
     except Exception as e:
@@ -342,7 +541,7 @@ def eliminar_cita(request: Request) -> Response:
 # -----------------------------------------------------------------------------
 def listar_citas_firestore(request: Request) -> Response:
     if request.method != 'GET':
-        body = json.dumps({
+        body = orjson.dumps({
             "success": False,
             "error": "Invalid HTTP method. Only GET requests are allowed."
         })
@@ -355,7 +554,7 @@ def listar_citas_firestore(request: Request) -> Response:
         args = request.args or {}
         limit = int(args.get("limit", "100"))
         id_paciente = args.get("id_paciente")
-        service = CitasConsultorioService()
+        service = _get_service()
         eventos = service.listar_citas_firestore(limit=limit, id_paciente=id_paciente)
         return _json_response({"success": True, "data": eventos, "message": "Citas (Firestore) listadas exitosamente"})
     except Exception as e:
@@ -376,7 +575,7 @@ def guardar_cita_firestore(request: Request) -> Response:
         return _bad_request("id_evento y data son requeridos.")
 
     try:
-        service = CitasConsultorioService()
+        service = _get_service()
         saved = service.guardar_cita_firestore(id_evento, data)
         return _json_response({"success": True, "data": saved, "message": "Evento guardado en Firestore"})
     except Exception as e:
@@ -397,7 +596,7 @@ def actualizar_cita_firestore(request: Request) -> Response:
         return _bad_request("id_evento y data son requeridos.")
 
     try:
-        service = CitasConsultorioService()
+        service = _get_service()
         updated = service.actualizar_cita_firestore(id_evento, data)
         return _json_response({"success": True, "data": updated, "message": "Evento actualizado en Firestore"})
     except Exception as e:
@@ -417,7 +616,7 @@ def eliminar_cita_firestore(request: Request) -> Response:
         return _bad_request("id_evento es requerido.")
 
     try:
-        service = CitasConsultorioService()
+        service = _get_service()
         service.eliminar_cita_firestore(id_evento)
         return _json_response({"success": True, "message": "Evento eliminado de Firestore"})
     except Exception as e:
@@ -1,23 +1,98 @@
 import datetime as dt
-import json
+import functools
 import logging
 import os.path
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dotenv import load_dotenv
 from pathlib import Path
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+# Las librerías de Google (googleapiclient, google-auth, oauthlib) se importan
+# dentro de los métodos que las usan: cargarlas es costoso y así no se paga en el
+# arranque en frío de los endpoints que no llegan a llamar al calendario.
 
 # If modifying these scopes, delete the file token.json.
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
-_env_path = Path(__file__).resolve().parents[3] / ".env"
-if _env_path.exists():
-    load_dotenv(dotenv_path=_env_path, override=False)
+# Campos que devuelve lista_eventos_proximos por defecto: lo que muestra el
+# listado de citas, sin creator/organizer/reminders/conferenceData/etags.
+CAMPOS_LISTA_EVENTOS = "items(id,status,htmlLink,summary,description,start,end,attendees(email,responseStatus))"
+
+@functools.lru_cache(maxsize=1)
+def _ensure_env_loaded() -> None:
+    """
+    Carga el .env local (solo existe en desarrollo) la primera vez que se
+    necesita, en lugar de al importar el módulo.
+    """
+    env_path = Path(__file__).resolve().parents[3] / ".env"
+    if env_path.exists():
+        load_dotenv(dotenv_path=env_path, override=False)
+
+@functools.lru_cache(maxsize=1)
+def _rutas_credenciales() -> tuple[str, str]:
+    """
+    Rutas del archivo de tokens y del de secretos del cliente, resueltas una vez.
+    Las variables de entorno tienen prioridad sobre los archivos junto a este módulo.
+    Returns:
+        (token_file, client_secret_file)
+    """
+    _ensure_env_loaded()
+    base_dir = Path(__file__).parent
+    token_file = os.getenv(
+        "GOOGLE_CALENDAR_TOKEN_FILE",
+        str(base_dir / "token_calendar.json")  # Use a consistent name for user tokens
+    )
+    client_secret_file = os.getenv(
+        "GOOGLE_CLIENT_SECRET_FILE",
+        str(base_dir / "client-secret.json")  # Your application's client secret
+    )
+    return token_file, client_secret_file
+
+# Servicio autenticado compartido por todas las instancias del contenedor
+_servicio_compartido = None
+_credenciales_compartidas = None
+_servicio_lock = threading.Lock()
+
+# httplib2.Http no es seguro entre hilos: cada hilo del contenedor mantiene su
+# propia conexión autorizada (keep-alive) y la reutiliza entre peticiones.
+_http_local = threading.local()
+
+# El token de acceso se renueva en segundo plano cuando le quedan menos de
+# _MARGEN_REFRESCO, para que ninguna petición espere al endpoint de OAuth.
+_MARGEN_REFRESCO = dt.timedelta(minutes=5)
+_refresco_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calendar-refresh")
+_refresco_lock = threading.Lock()
+_refresco_pendiente: Future | None = None
+
+
+def _refrescar_credenciales() -> None:
+    from google.auth.transport.requests import Request
+
+    credenciales = _credenciales_compartidas
+    credenciales.refresh(Request())
+    token_file, _ = _rutas_credenciales()
+    try:
+        with open(token_file, "w") as token:
+            token.write(credenciales.to_json())
+    except OSError as e:
+        logging.warning("No se pudo guardar el token renovado en %s: %s", token_file, e)
+
+
+def _programar_refresco() -> None:
+    """
+    Lanza la renovación del token en segundo plano si está por expirar.
+    Si el token ya expiró, AuthorizedHttp lo renueva al hacer la petición.
+    """
+    global _refresco_pendiente
+    credenciales = _credenciales_compartidas
+    if credenciales is None or credenciales.expiry is None or not credenciales.refresh_token:
+        return
+    if credenciales.expiry - dt.datetime.utcnow() > _MARGEN_REFRESCO:
+        return
+    with _refresco_lock:
+        if _refresco_pendiente is None or _refresco_pendiente.done():
+            _refresco_pendiente = _refresco_pool.submit(_refrescar_credenciales)
 
 # Clase para gestionar el calendario de Google
 class AdministradorCalendarioGoogle:
@@ -40,9 +115,31 @@ class AdministradorCalendarioGoogle:
         ValueError: Si los parámetros de entrada son inválidos.
     """
 
-    # Inicializa el servicio de Google Calendar
-    def __init__(self):
-        self.servicio = self._autenticar()
+    # El servicio de Google Calendar se autentica en el primer uso (no al
+    # construir la clase), así el arranque en frío no paga OAuth ni discovery.
+    @property
+    def servicio(self):
+        global _servicio_compartido
+        if _servicio_compartido is None:
+            with _servicio_lock:
+                if _servicio_compartido is None:
+                    _servicio_compartido = self._autenticar()
+        return _servicio_compartido
+
+    def _http(self):
+        """
+        Devuelve la conexión HTTP autorizada (AuthorizedHttp) del hilo actual,
+        creándola la primera vez.
+        """
+        http = getattr(_http_local, "http", None)
+        _programar_refresco()
+        if http is None:
+            from google_auth_httplib2 import AuthorizedHttp
+            from googleapiclient.http import build_http
+
+            self.servicio  # garantiza que las credenciales ya estén cargadas
+            http = _http_local.http = AuthorizedHttp(_credenciales_compartidas, http=build_http())
+        return http
 
     # Método para autenticar el servicio de Google Calendar
     def _autenticar(self):
@@ -51,46 +148,40 @@ class AdministradorCalendarioGoogle:
         Returns:
             servicio: Instancia del servicio de Google Calendar autenticado.
         """
+        global _credenciales_compartidas
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from googleapiclient.discovery import build
+
         try:
             credenciales = None
-            token_file = "token_calendar.json" # Use a consistent name for user tokens
-            client_secret_file = "client-secret.json" # Your application's client secret
-            base_dir = Path(__file__).parent
-            token_file = os.getenv(
-                "GOOGLE_CALENDAR_TOKEN_FILE",
-                str(base_dir / token_file)
-            )
-            logging.info(f"Usando archivo de tokens: {token_file}")
-
-            client_secret_file = os.getenv(
-                "GOOGLE_CLIENT_SECRET_FILE",
-                str(base_dir / client_secret_file)
-            )
-            logging.info(f"Usando archivo de secretos del cliente: {client_secret_file}")
+            token_file, client_secret_file = _rutas_credenciales()
+            logging.info("Usando archivo de tokens: %s", token_file)
+            logging.info("Usando archivo de secretos del cliente: %s", client_secret_file)
 
             # 1. Try to load existing user credentials (tokens)
             if os.path.exists(token_file):
-                logging.info(f"El archivo de tokens '{token_file}' existe.")
+                logging.info("El archivo de tokens '%s' existe.", token_file)
                 try: 
                     credenciales = Credentials.from_authorized_user_file(token_file, SCOPES)
                     logging.info("Credenciales cargadas desde el archivo de tokens.")
                 except Exception as e:
-                    logging.error(f"Error al cargar credenciales desde el archivo de tokens: {e}")
+                    logging.error("Error al cargar credenciales desde el archivo de tokens: %s", e)
                     credenciales = None
             else:
-                logging.info(f"El archivo de tokens '{token_file}' no existe.")
+                logging.info("El archivo de tokens '%s' no existe.", token_file)
                 logging.info("No se encontró token, se requiere autenticación.")
             
-            logging.info(f"Credenciales antes de la validación: {credenciales}")
+            logging.info("Credenciales antes de la validación: %s", credenciales)
 
             # 2. If no valid credentials, initiate the full OAuth flow
             if not credenciales or not credenciales.valid:
-                print("No se encontraron credenciales válidas, iniciando flujo de autenticación.")
                 logging.info("No se encontraron credenciales válidas, iniciando flujo de autenticación.")
 
                 # Refresh if expired and refresh_token exists
                 if credenciales and credenciales.expired and credenciales.refresh_token:
-                    print("Credenciales expiradas, intentando refrescar.")
+                    logging.info("Credenciales expiradas, intentando refrescar.")
                     credenciales.refresh(Request())
                 else:
                     # Start the flow using the application's client_secret.json
@@ -99,18 +190,27 @@ class AdministradorCalendarioGoogle:
                         raise FileNotFoundError(f"Error: El archivo de secretos del cliente '{client_secret_file}' no se encontró.")
 
                     flujo = InstalledAppFlow.from_client_secrets_file(client_secret_file, SCOPES)
-                    print("Iniciando el servidor local para la autenticación...")
+                    logging.info("Iniciando el servidor local para la autenticación...")
                     credenciales = flujo.run_local_server()
 
                 # Save the obtained credentials (including refresh_token) for future use
                 with open(token_file, "w") as token:
                     token.write(credenciales.to_json())
-                print(f"Credenciales guardadas en '{token_file}'.")
-
-            print("Autenticación exitosa.")
-            return build("calendar", "v3", credentials=credenciales)
+                logging.info("Credenciales guardadas en '%s'.", token_file)
+
+            logging.info("Autenticación exitosa.")
+            _credenciales_compartidas = credenciales
+            # El documento de discovery de calendar v3 viene empaquetado con
+            # google-api-python-client: se lee del disco, sin petición HTTP
+            return build(
+                "calendar",
+                "v3",
+                credentials=credenciales,
+                static_discovery=True,
+                cache_discovery=False,
+            )
         except Exception as e:
-            logging.error(f"Error al autenticar con Google Calendar: {e}")
+            logging.error("Error al autenticar con Google Calendar: %s", e)
             raise
 
 
@@ -119,38 +219,44 @@ class AdministradorCalendarioGoogle:
     def lista_eventos_proximos(
             self,
             max_resultados: int = 50,
+            fields: str | None = CAMPOS_LISTA_EVENTOS,
             ) -> list:
         """
         Lista los próximos eventos en el calendario.
         Args:
             max_resultados (int): Número máximo de eventos a listar.
+            fields (str, optional): Máscara de campos de la respuesta; None devuelve el recurso completo.
         Returns:
             eventos (list): Lista de eventos próximos.
         """
-        ahora = dt.datetime.now(dt.timezone.utc).isoformat()
-        manana = (dt.datetime.now(dt.timezone.utc) + dt.timedelta(days=30)).replace(hour=23, minute=59, second=0, microsecond=0).isoformat()
+        ahora_dt = dt.datetime.now(dt.timezone.utc)
+        ahora = ahora_dt.isoformat()
+        manana = (ahora_dt + dt.timedelta(days=30)).replace(hour=23, minute=59, second=0, microsecond=0).isoformat()
 
         resultados_eventos = self.servicio.events().list(
             calendarId='primary',
             timeMin=ahora, timeMax=manana,
             maxResults=max_resultados,
             singleEvents=True,
-            orderBy='startTime'
-        ).execute()
+            orderBy='startTime',
+            fields=fields,
+        ).execute(http=self._http())
         eventos = resultados_eventos.get('items', [])
 
         if not eventos:
-            print('No se encontraron eventos próximos.')
-        else:
+            logging.info('No se encontraron eventos próximos.')
+        elif logging.getLogger().isEnabledFor(logging.DEBUG):
+            # El detalle por evento solo se recorre si DEBUG está activo
             for evento in eventos:
-                inicio = evento['start'].get('dateTime', evento['start'].get('date'))
-                print(inicio, evento.get('summary'), evento.get('id'))
-        
+                start = evento['start']
+                inicio = start.get('dateTime') or start.get('date')
+                logging.debug("%s %s %s", inicio, evento.get('summary'), evento.get('id'))
+
         return eventos
 
-    # Método para crear un nuevo evento en el calendario
-    def crear_evento(
-            self,
+    # Construye el cuerpo de un evento para insertarlo en Google Calendar
+    @staticmethod
+    def _cuerpo_evento(
             nombre_evento: str,
             descripcion_evento: str,
             inicio: str,
@@ -158,18 +264,6 @@ class AdministradorCalendarioGoogle:
             zona_horaria: str,
             asistentes: list | None,
             ) -> dict:
-        """
-        Crea un nuevo evento en el calendario.
-        Args:
-            nombre_evento (str): Nombre o resumen del evento.
-            inicio (str): Fecha y hora de inicio del evento en formato ISO 8601.
-            fin (str): Fecha y hora de fin del evento en formato ISO 8601.
-            zona_horaria (str): Zona horaria del evento (por ejemplo, 'Europe/Madrid').
-            asistentes (list, optional): Lista de correos electrónicos de los asistentes al evento. Defaults to None.
-        Returns:
-            evento (dict): Detalles del evento creado.
-        """
-
         # Crear el cuerpo del evento
         evento: dict = {
             'summary': nombre_evento,
@@ -204,16 +298,85 @@ class AdministradorCalendarioGoogle:
             # Se usa una COMPRENSIÓN DE LISTAS para crear la lista de asistentes
             evento["attendees"] = [{"email": email} for email in asistentes]
 
+        return evento
+
+    # Método para crear un nuevo evento en el calendario
+    def crear_evento(
+            self,
+            nombre_evento: str,
+            descripcion_evento: str,
+            inicio: str,
+            fin: str,
+            zona_horaria: str,
+            asistentes: list | None,
+            ) -> dict:
+        """
+        Crea un nuevo evento en el calendario.
+        Args:
+            nombre_evento (str): Nombre o resumen del evento.
+            inicio (str): Fecha y hora de inicio del evento en formato ISO 8601.
+            fin (str): Fecha y hora de fin del evento en formato ISO 8601.
+            zona_horaria (str): Zona horaria del evento (por ejemplo, 'Europe/Madrid').
+            asistentes (list, optional): Lista de correos electrónicos de los asistentes al evento. Defaults to None.
+        Returns:
+            evento (dict): Detalles del evento creado.
+        """
+
+        from googleapiclient.errors import HttpError
+
+        evento = self._cuerpo_evento(
+            nombre_evento, descripcion_evento, inicio, fin, zona_horaria, asistentes
+        )
+
         try:
             # Llamar a la API de Google Calendar para crear el evento
-            evento = self.servicio.events().insert(calendarId="primary", body=evento).execute()
-            print(f"Evento creado: {evento.get('htmlLink')}")
-            print("El evento es:", json.dumps(evento))
+            evento = self.servicio.events().insert(calendarId="primary", body=evento).execute(http=self._http())
+            logging.info("Evento creado: %s", evento.get('htmlLink'))
+            logging.debug("El evento es: %s", evento)
             return evento
         except HttpError as error:
-            print(f"Ocurrió un error: {error}")
+            logging.error("Ocurrió un error: %s", error)
             return {"error": str(error)}
 
+    # Construye el cuerpo PATCH con solo los campos que cambian.
+    # PATCH no necesita leer el evento antes (un RPC en lugar de dos) y fusiona
+    # los objetos anidados como start/end, así que su timeZone se conserva.
+    @staticmethod
+    def _cambios_evento(
+            resumen: str | None = None,
+            description: str | None = None,
+            inicio: dt.datetime | None = None,
+            fin: dt.datetime | None = None,
+            asistentes: list | None = None,
+    ) -> dict:
+        cambios: dict = {}
+        if resumen:
+            cambios['summary'] = resumen
+
+        if description:
+            cambios['description'] = description
+
+        # Actualizar la fecha y hora de inicio
+        if inicio:
+            # Si inicio es datetime, formatear; si es string dejarlo tal cual
+            if hasattr(inicio, "strftime"):
+                cambios['start'] = {'dateTime': inicio.strftime('%Y-%m-%dT%H:%M:%S')}
+            else:
+                cambios['start'] = {'dateTime': inicio}
+
+        if fin:
+            if hasattr(fin, "strftime"):
+                cambios['end'] = {'dateTime': fin.strftime('%Y-%m-%dT%H:%M:%S')}
+            else:
+                cambios['end'] = {'dateTime': fin}
+
+        if asistentes is not None:
+            cambios['attendees'] = [{"email": email} for email in asistentes]
+
+        if not cambios:
+            raise ValueError("No se proporcionó ningún campo para actualizar.")
+        return cambios
+
     # Método para actualizar un evento existente
     def actualizar_evento(
             self,
@@ -236,40 +399,17 @@ class AdministradorCalendarioGoogle:
         Raises:
             ValueError: Si no se proporciona ningún campo para actualizar.
         """
-        try:
-            # Obtener el evento existente
-            evento: dict = self.servicio.events().get(calendarId='primary', eventId=evento_id).execute()
-
-            # Actualizar los campos proporcionados
-            if resumen:
-                evento['summary'] = resumen
+        from googleapiclient.errors import HttpError
 
-            if description:
-                evento['description'] = description
+        cambios = self._cambios_evento(resumen, description, inicio, fin, asistentes)
 
-            # Actualizar la fecha y hora de inicio
-            if inicio:
-                # Si inicio es datetime, formatear; si es string dejarlo tal cual
-                if hasattr(inicio, "strftime"):
-                    evento['start']['dateTime'] = inicio.strftime('%Y-%m-%dT%H:%M:%S')
-                else:
-                    evento['start']['dateTime'] = inicio
-
-            if fin:
-                if hasattr(fin, "strftime"):
-                    evento['end']['dateTime'] = fin.strftime('%Y-%m-%dT%H:%M:%S')
-                else:
-                    evento['end']['dateTime'] = fin
-            
-            if asistentes is not None:
-                evento['attendees'] = [{"email": email} for email in asistentes]
-
-            evento_actualizado = self.servicio.events().update(
-                calendarId='primary', eventId=evento_id, body=evento).execute()
-            print(f"Evento actualizado: {json.dumps(evento_actualizado)}")
+        try:
+            evento_actualizado = self.servicio.events().patch(
+                calendarId='primary', eventId=evento_id, body=cambios).execute(http=self._http())
+            logging.debug("Evento actualizado: %s", evento_actualizado)
             return evento_actualizado
         except HttpError as error:
-            print(f"Ocurrió un error al actualizar el evento: {error}")
+            logging.error("Ocurrió un error al actualizar el evento: %s", error)
             return {"error": str(error)}
 
     def eliminar_evento(
@@ -285,12 +425,99 @@ class AdministradorCalendarioGoogle:
         Raises:
             HttpError: Si ocurre un error al intentar eliminar el evento.
         """
+        from googleapiclient.errors import HttpError
+
         try:
             # Llamar a la API de Google Calendar para eliminar el evento
-            self.servicio.events().delete(calendarId='primary', eventId=evento_id).execute()
-            print(f"Evento con ID {evento_id} eliminado.")
+            self.servicio.events().delete(calendarId='primary', eventId=evento_id).execute(http=self._http())
+            logging.info("Evento con ID %s eliminado.", evento_id)
             return True
         except HttpError as error:
-            print(f"Ocurrió un error al eliminar el evento: {error}")
+            logging.error("Ocurrió un error al eliminar el evento: %s", error)
             return False
-    
+
+    # Google Calendar acepta hasta 50 sub-peticiones por lote
+    _TAMANO_LOTE = 50
+
+    def _ejecutar_lote(self, peticiones: list) -> list:
+        """
+        Ejecuta peticiones de la API en lotes (BatchHttpRequest), un RPC por cada 50.
+        Args:
+            peticiones (list): Peticiones ya construidas, p. ej. events().insert(...).
+        Returns:
+            list: Resultado de cada petición en el mismo orden; {"error": ...} si falló.
+        """
+        resultados: list = [None] * len(peticiones)
+
+        def _callback(request_id, respuesta, excepcion):
+            indice = int(request_id)
+            resultados[indice] = {"error": str(excepcion)} if excepcion else respuesta
+
+        for inicio in range(0, len(peticiones), self._TAMANO_LOTE):
+            lote = self.servicio.new_batch_http_request(callback=_callback)
+            for indice in range(inicio, min(inicio + self._TAMANO_LOTE, len(peticiones))):
+                lote.add(peticiones[indice], request_id=str(indice))
+            lote.execute(http=self._http())
+        return resultados
+
+    def crear_eventos_batch(self, eventos: list[dict]) -> list[dict]:
+        """
+        Crea varios eventos con una sola petición HTTP por cada 50 eventos.
+        Args:
+            eventos (list): Diccionarios con los mismos argumentos que crear_evento.
+        Returns:
+            list: Evento creado (o {"error": ...}) por cada entrada, en el mismo orden.
+        """
+        peticiones = [
+            self.servicio.events().insert(
+                calendarId="primary",
+                body=self._cuerpo_evento(
+                    e["nombre_evento"],
+                    e["descripcion_evento"],
+                    e["inicio"],
+                    e["fin"],
+                    e["zona_horaria"],
+                    e.get("asistentes"),
+                ),
+            )
+            for e in eventos
+        ]
+        return self._ejecutar_lote(peticiones)
+
+    def actualizar_eventos_batch(self, cambios: list[tuple[str, dict]]) -> list[dict]:
+        """
+        Actualiza varios eventos con una sola petición HTTP por cada 50 eventos.
+        Args:
+            cambios (list): Pares (evento_id, campos) donde campos lleva los mismos
+                argumentos opcionales que actualizar_evento.
+        Returns:
+            list: Evento actualizado (o {"error": ...}) por cada entrada, en el mismo orden.
+        Raises:
+            ValueError: Si alguna entrada no trae ningún campo para actualizar.
+        """
+        peticiones = [
+            self.servicio.events().patch(
+                calendarId='primary',
+                eventId=evento_id,
+                body=self._cambios_evento(**campos),
+            )
+            for evento_id, campos in cambios
+        ]
+        return self._ejecutar_lote(peticiones)
+
+    def eliminar_eventos_batch(self, evento_ids: list[str]) -> list[bool]:
+        """
+        Elimina varios eventos con una sola petición HTTP por cada 50 eventos.
+        Args:
+            evento_ids (list): IDs de los eventos a eliminar.
+        Returns:
+            list: True/False por cada evento, en el mismo orden.
+        """
+        peticiones = [
+            self.servicio.events().delete(calendarId='primary', eventId=evento_id)
+            for evento_id in evento_ids
+        ]
+        return [
+            not (isinstance(r, dict) and "error" in r)
+            for r in self._ejecutar_lote(peticiones)
+        ]
@@ -0,0 +1,45 @@
+"""
+Cliente de Firestore compartido por todos los servicios del contenedor.
+
+El SDK de Python de firebase-admin solo ofrece el transporte gRPC para
+Firestore (no existe el equivalente a ``preferRest`` del SDK de Node), por lo
+que el costo de abrir el canal se paga una sola vez por contenedor: los
+servicios deben pedir el cliente aquí en lugar de llamar a
+``firestore.client()`` por su cuenta.
+
+No hace falta configurar keepalive a mano: google-cloud-firestore ya crea su
+canal con ``grpc.keepalive_time_ms=30000``, así que un contenedor caliente
+conserva la conexión HTTP/2 entre invocaciones mientras nadie cierre el cliente.
+
+La app de firebase-admin también se inicializa aquí, bajo demanda, para que los
+contenedores que nunca usan Firestore (p. ej. ``chat_agent``) no paguen ese costo.
+"""
+import functools
+import threading
+import firebase_admin
+from firebase_admin import firestore
+
+_app_lock = threading.Lock()
+
+
+def ensure_firebase_app() -> firebase_admin.App:
+    """
+    Inicializa la app por defecto de firebase-admin si aún no existe.
+    Returns:
+        La app por defecto de firebase-admin.
+    """
+    with _app_lock:
+        try:
+            return firebase_admin.get_app()
+        except ValueError:
+            return firebase_admin.initialize_app()
+
+
+@functools.lru_cache(maxsize=1)
+def get_firestore_client() -> firestore.firestore.Client:
+    """
+    Devuelve el cliente de Firestore del contenedor, creándolo la primera vez.
+    Returns:
+        Cliente de Firestore reutilizable entre peticiones.
+    """
+    return firestore.client(ensure_firebase_app())
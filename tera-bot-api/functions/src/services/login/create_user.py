@@ -1,8 +1,18 @@
 from firebase_admin import firestore
+from google.api_core.exceptions import AlreadyExists
+import bcrypt
+import hashlib
 import logging
-import json
+import orjson
 
 from flask import Request, Response
+from src.services.firebase.firestore_client import get_firestore_client
+
+# Cuerpos de error constantes: se serializan una sola vez al importar el módulo
+_NO_JSON_BODY = orjson.dumps({"success": False, "error": "No JSON body found"})
+_MISSING_FIELDS_BODY = orjson.dumps({"success": False, "error": "Invalid request: Missing required fields"})
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -10,15 +20,12 @@ logger = logging.getLogger(__name__)
 def create_user_http(request: Request) -> Response:
     request_json = request.get_json(silent=True)
     if not request_json:
-        body = json.dumps({
-            "success": False,
-            "error": "No JSON body found"
-        })
+        body = _NO_JSON_BODY
         logging.error("No JSON body found in the request")
         return Response(
             body,
             status=400,
-            headers={"Content-Type": "application/json"}
+            headers=_JSON_HEADERS
         )
 
     contrasenia = request_json.get('contrasenia')
@@ -26,21 +33,18 @@ def create_user_http(request: Request) -> Response:
     admin = request_json.get('admin', False)
 
     if not contrasenia or not usuario:
-        body = json.dumps({
-            "success": False,
-            "error": "Invalid request: Missing required fields"
-        })
+        body = _MISSING_FIELDS_BODY
         logging.error("Missing required fields: 'contrasenia' or 'usuario'")
         return Response(
             body,
             status=400,
-            headers={"Content-Type": "application/json"}
+            headers=_JSON_HEADERS
         )
 
     try:
         user_id = create_user(usuario, contrasenia, admin)
-        logging.info(f'usuario creado con el UID: {user_id}')
-        body = json.dumps({
+        logging.info('usuario creado con el UID: %s', user_id)
+        body = orjson.dumps({
             "success": True,
             "uid": user_id['uid'],
             "admin": user_id['admin']
@@ -48,20 +52,35 @@ def create_user_http(request: Request) -> Response:
         return Response(
             body,
             status=201,
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
         )
     except Exception as e:
-        body = json.dumps({
+        body = orjson.dumps({
             "success": False,
             "error": str(e)
         })
-        logging.error(f'Error creating user: {str(e)}')
+        logging.error('Error creating user: %s', e)
         return Response(
             body,
             status=500,
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
         )
 
+def user_doc_id(usuario: str) -> str:
+    """
+    ID del documento del usuario en la colección 'users'.
+    Se deriva del nombre de usuario para que buscarlo sea una lectura directa y
+    para que Firestore garantice que no haya dos cuentas con el mismo nombre.
+    El hash evita caracteres no válidos en IDs de documento (p. ej. '/').
+    """
+    return hashlib.sha256(usuario.encode("utf-8")).hexdigest()
+
+def hash_password(contrasenia: str) -> str:
+    """
+    Hash bcrypt (con sal propia) de la contraseña, listo para guardar en Firestore.
+    """
+    return bcrypt.hashpw(contrasenia.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode("ascii")
+
 def create_user(
         usuario: str,
         contrasenia: str,
@@ -73,27 +92,22 @@ def create_user(
         user_id (str): El ID del usuario.
         display_name (str): El nombre para mostrar del usuario.
     """
-    db = firestore.client()
+    db = get_firestore_client()
     try:
-        # Verificar si el usuario ya existe
-        users_ref = db.collection('users')
-        # Realizamos una consulta para encontrar el usuario
-        query = users_ref.where('usuario', '==', usuario).limit(1)
-        results = query.stream()
-        for user_doc in results:
-            logging.error(f'Fallo la creacion del usuario: El usuario {usuario} ya existe.')
-            raise ValueError("Usuario ya existe")
-
-        # Referencias a los documentos de Firestore para la colección 'users', 'pacientes' y 'threads'
-        ref_usuario = db.collection('users').document()
-        ref_paciente = db.collection('pacientes').document(ref_usuario.id)
-        ref_thread = db.collection('threads').document(ref_usuario.id)
+        # Referencias a los documentos de Firestore para la colección 'users', 'pacientes' y 'threads'.
+        # El usuario se guarda con un ID derivado de su nombre; el paciente y el
+        # thread conservan un ID generado, que es el UID que ve el cliente.
+        ref_usuario = db.collection('users').document(user_doc_id(usuario))
+        ref_paciente = db.collection('pacientes').document()
+        ref_thread = db.collection('threads').document(ref_paciente.id)
 
-        # Crear un batch para realizar múltiples escrituras atómicas
+        # Crear un batch para realizar múltiples escrituras atómicas.
+        # create() falla si el usuario ya existe y con él todo el batch, así que
+        # la verificación y la escritura son un solo RPC sin condiciones de carrera.
         batch = db.batch()
-        batch.set(ref_usuario, {
+        batch.create(ref_usuario, {
             'usuario': usuario,
-            'contrasenia': contrasenia,
+            'contrasenia_hash': hash_password(contrasenia),
             'admin': admin,
             'fecha_creacion': firestore.firestore.SERVER_TIMESTAMP,
             'ref_paciente': ref_paciente
@@ -113,15 +127,17 @@ def create_user(
         })
 
         # Commit del batch
-        batch.commit()
-        logger.info(f'User {ref_usuario.id} saved to Firestore with display name {usuario}')
+        try:
+            batch.commit()
+        except AlreadyExists:
+            logging.error('Fallo la creacion del usuario: El usuario %s ya existe.', usuario)
+            raise ValueError("Usuario ya existe")
+        logger.info('User %s saved to Firestore with display name %s', ref_usuario.id, usuario)
         return {
             "uid": ref_paciente.id,
             "admin": admin,
         }
     except Exception as e:
-        logger.error(f'Error saving user to Firestore: {e}')
+        logger.error('Error saving user to Firestore: %s', e)
         raise
-    finally:
-        db.close()
     
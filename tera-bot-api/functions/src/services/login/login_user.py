@@ -1,8 +1,19 @@
 from firebase_admin import firestore, credentials, auth
+import bcrypt
+import hmac
 import logging
-import json
+import orjson
 
 from flask import Request, Response
+from src.services.firebase.firestore_client import ensure_firebase_app, get_firestore_client
+from src.services.login.create_user import hash_password, user_doc_id
+
+# Cuerpos de error constantes: se serializan una sola vez al importar el módulo
+_NO_JSON_BODY = orjson.dumps({"success": False, "error": "No JSON body found"})
+_MISSING_FIELDS_BODY = orjson.dumps({"success": False, "error": "Invalid request: Missing required fields"})
+_AUTH_FAILED_BODY = orjson.dumps({"success": False, "error": "Authentication failed"})
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 def login_user_http(request: Request) -> Response:
     """
@@ -15,37 +26,31 @@ def login_user_http(request: Request) -> Response:
     """
     request_json = request.get_json(silent=True)
     if not request_json:
-        body = json.dumps({
-            "success": False,
-            "error": "No JSON body found"
-        })
+        body = _NO_JSON_BODY
         logging.error("No JSON body found in the request")
         return Response(
             body,
             status=400,
-            headers={"Content-Type": "application/json"}
+            headers=_JSON_HEADERS
         )
 
     usuario = request_json.get('usuario')
     contrasenia = request_json.get('contrasenia')
 
     if not usuario or not contrasenia:
-        body = json.dumps({
-            "success": False,
-            "error": "Invalid request: Missing required fields"
-        })
+        body = _MISSING_FIELDS_BODY
         logging.error("Missing required fields: 'usuario' or 'contrasenia'")
         return Response(
             body,
             status=400,
-            headers={"Content-Type": "application/json"}
+            headers=_JSON_HEADERS
         )
 
     try:
         # Llamar a la funcion de autenticacion
         user_id = login_with_data_base(usuario, contrasenia)
         if user_id:
-            body = json.dumps({
+            body = orjson.dumps({
                 "success": True,
                 "uid": user_id['uid'],
                 "admin": user_id['admin']
@@ -53,29 +58,26 @@ def login_user_http(request: Request) -> Response:
             return Response(
                 body,
                 status=200,
-                headers={"Content-Type": "application/json"},
+                headers=_JSON_HEADERS,
             )
         else:
-            body = json.dumps({
-                "success": False,
-                "error": "Authentication failed"
-            })
+            body = _AUTH_FAILED_BODY
             logging.error("Authentication failed for user")
             return Response(
                 body,
                 status=401,
-                headers={"Content-Type": "application/json"},
+                headers=_JSON_HEADERS,
             )
     except Exception as e:
-        body = json.dumps({
+        body = orjson.dumps({
             "success": False,
             "error": str(e)
         })
-        logging.error(f'Error logging in user: {str(e)}')
+        logging.error('Error logging in user: %s', e)
         return Response(
             body,
             status=500,
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
         )
 
 
@@ -89,26 +91,37 @@ def login_with_data_base(usuario: str, contrasenia: str) -> dict[str, bool]:
         dict: A dictionary containing the user's UID and a thread ID if authentication is successful.
     """
     try:
-        # Inicializar instancia de Firestore
-        db = firestore.client()
-        users_ref = db.collection('users')
+        # Lectura directa del documento del usuario (su ID se deriva del nombre)
+        db = get_firestore_client()
+        user_doc = db.collection('users').document(user_doc_id(usuario)).get()
+        if not user_doc.exists:
+            return {}
 
-        # Realizamos una consulta para encontrar el usuario con las credenciales proporcionadas
-        query = users_ref.where('usuario', '==', usuario).where('contrasenia', '==', contrasenia).limit(1)
+        # Obtenemos los datos del usuario y verificamos la contraseña
+        user_data = user_doc.to_dict()
+        contrasenia_hash = user_data.get('contrasenia_hash')
+        if contrasenia_hash:
+            if not bcrypt.checkpw(contrasenia.encode('utf-8'), contrasenia_hash.encode('ascii')):
+                return {}
+        else:
+            # Cuentas antiguas con la contraseña en texto plano: se compara en
+            # tiempo constante y se reemplaza por su hash en este primer login
+            contrasenia_guardada = user_data.get('contrasenia') or ''
+            if not hmac.compare_digest(contrasenia_guardada.encode('utf-8'), contrasenia.encode('utf-8')):
+                return {}
+            user_doc.reference.update({
+                'contrasenia_hash': hash_password(contrasenia),
+                'contrasenia': firestore.firestore.DELETE_FIELD,
+            })
 
-        # Ejecutamos la consulta
-        results = query.stream()
-        
-        # Si encontramos un usuario que coincide, devolvemos su UID y thread ID
-        for user_doc in results:
-            # Obtenemos los datos del usuario
-            user_data = user_doc.to_dict()
-            return {
-                "uid": user_doc.id,
-                "admin": user_data.get('admin', False)
-            }
+        # El UID es el ID del paciente; en cuentas antiguas coincide con el del usuario
+        ref_paciente = user_data.get('ref_paciente')
+        return {
+            "uid": ref_paciente.id if ref_paciente else user_doc.id,
+            "admin": user_data.get('admin', False)
+        }
     except Exception as e:
-        logging.error(f"Error de autenticación {usuario}: {e}")
+        logging.error("Error de autenticación %s: %s", usuario, e)
     return {}
 
 def login_with_firecrebase_auth(usuario: str, contrasenia: str) -> dict[str, bool]:
@@ -122,7 +135,7 @@ def login_with_firecrebase_auth(usuario: str, contrasenia: str) -> dict[str, boo
     """
     try:
         # Intentar autenticar al usuario con Firebase Auth
-        user = auth.get_user_by_email(usuario)
+        user = auth.get_user_by_email(usuario, app=ensure_firebase_app())
         # Aquí deberías verificar la contraseña, pero Firebase Admin SDK no permite verificar contraseñas directamente.
         # Normalmente, esto se hace en el cliente o mediante un servicio de autenticación personalizado.
 
@@ -132,7 +145,7 @@ def login_with_firecrebase_auth(usuario: str, contrasenia: str) -> dict[str, boo
             "admin": user.custom_claims.get('admin', False) if user.custom_claims else False
         }
     except auth.UserNotFoundError:
-        logging.error(f"Usuario no encontrado: {usuario}")
+        logging.error("Usuario no encontrado: %s", usuario)
     except Exception as e:
-        logging.error(f"Error de autenticación con Firebase Auth {usuario}: {e}")
+        logging.error("Error de autenticación con Firebase Auth %s: %s", usuario, e)
     return {}
\ No newline at end of file
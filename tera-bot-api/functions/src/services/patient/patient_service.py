@@ -1,62 +1,134 @@
+import atexit
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from flask import Request, Response
 from firebase_admin import firestore
+from google.cloud.firestore_v1 import DocumentReference, GeoPoint
 import logging
-import json
+import orjson
+import threading
+import time
+from typing import Iterator
 from src.modelos.all_info import AllInfo
 from src.modelos.ficha_medica import FichaMedica
 from src.modelos.sigsa import Sigsa
 from src.modelos.paciente import Paciente
+from src.modelos.utils import model_to_dict
+from src.services.firebase.firestore_client import get_firestore_client
+
+# Lecturas independientes de Firestore en paralelo (el SDK bloquea en cada stream)
+_io_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="patients-io")
+
+# Campos que consumen los modelos; los listados solo piden estos a Firestore y
+# los GET de un documento responden exactamente con estos campos
+_PACIENTE_FIELDS = tuple(Paciente.__dataclass_fields__)
+_SIGSA_FIELDS = tuple(Sigsa.__dataclass_fields__)
+_FICHA_MEDICA_FIELDS = tuple(FichaMedica.__dataclass_fields__)
+
+# Campos que el cliente puede escribir; uid, referencias, hilo y numeración los pone el servidor
+_PACIENTE_INPUT_FIELDS = frozenset(_PACIENTE_FIELDS) - {"uid", "thread", "ref_sigsa", "ref_ficha_medica"}
+_SIGSA_INPUT_FIELDS = frozenset(_SIGSA_FIELDS) - {"uid", "created", "no_historia_clinica"}
+_FICHA_MEDICA_INPUT_FIELDS = frozenset(_FICHA_MEDICA_FIELDS) - {"uid"}
+
+@firestore.firestore.transactional
+def _crear_sigsa_con_numero(
+        transaction,
+        sigsa_ref: firestore.firestore.DocumentReference,
+        counter_ref: firestore.firestore.DocumentReference,
+    ) -> None:
+    """
+    Crea el documento SIGSA con el siguiente número de historia clínica.
+    El contador (counters/sigsa.next_id) y el documento se escriben en la misma
+    transacción, así dos altas simultáneas nunca reciben el mismo número.
+    """
+    if sigsa_ref.get(transaction=transaction).exists:
+        return
+
+    counter = counter_ref.get(transaction=transaction)
+    if counter.exists:
+        new_id = counter.get("next_id")
+        # Incremento en el servidor: la escritura no depende del valor leído
+        transaction.update(counter_ref, {"next_id": firestore.firestore.Increment(1)})
+    else:
+        # Primera vez: el contador arranca donde terminaba la numeración anterior
+        # (total de documentos SIGSA + 1), contado con una agregación en el servidor
+        new_id = sigsa_ref.parent.count().get()[0][0].value + 1
+        transaction.create(counter_ref, {"next_id": new_id + 1})
+
+    transaction.set(sigsa_ref, {
+        "created": firestore.firestore.SERVER_TIMESTAMP,
+        "no_historia_clinica": new_id
+    })
+
+# Caché por contenedor de los documentos de los GET: (colección, uid) -> (instante, datos).
+# Solo guarda documentos existentes. update_patient corre en otros contenedores y
+# no puede invalidarla, así que un cambio puede tardar hasta _DOC_CACHE_TTL
+# segundos en verse; `?nocache=1` fuerza una lectura nueva.
+# Los endpoints atienden peticiones concurrentes: todo acceso pasa por el lock.
+_DOC_CACHE_TTL = 30.0
+_DOC_CACHE_MAX = 1024
+_doc_cache: dict[tuple[str, str], tuple[float, dict]] = {}
+_doc_cache_lock = threading.Lock()
+
+# Cuerpos de error constantes: se serializan una sola vez al importar el módulo
+_NO_JSON_BODY = orjson.dumps({"success": False, "error": "No JSON body found"})
+_MISSING_PATIENT_ID_BODY = orjson.dumps({
+    "success": False,
+    "error": "Invalid request: Missing required field 'ref_patient'"
+})
+_INVALID_METHOD_BODY = orjson.dumps({
+    "success": False,
+    "error": "Invalid HTTP method. Only GET requests are allowed."
+})
+_METODO_INVALIDO_BODY = orjson.dumps({
+    "success": False,
+    "error": "Método HTTP inválido. Solo se permiten solicitudes GET."
+})
+_FALTA_UID_BODY = orjson.dumps({
+    "success": False,
+    "error": "Petición inválida: Falta el campo requerido 'uid'"
+})
+_NO_ENCONTRADO_BODY = orjson.dumps({
+    "success": False,
+    "error": "No se encontraron datos para el UID proporcionado"
+})
+_SUCCESS_BODY = orjson.dumps({"success": True})
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _json_response(body: bytes, status: int) -> Response:
+    return Response(body, status=status, headers=_JSON_HEADERS)
+
+def json_default(obj):
+    """
+    Hook `default` de orjson para los tipos de Firestore que no serializa solo.
+    Es la única conversión de Firestore a JSON: la usan los GET de este módulo y
+    el listado de pacientes de main.py.
+    """
+    # DatetimeWithNanoseconds es subclase de datetime y orjson no la toma como nativa
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, DocumentReference):
+        return obj.path
+    if isinstance(obj, GeoPoint):
+        return {"latitude": obj.latitude, "longitude": obj.longitude}
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.decode("utf-8", errors="ignore")
+    raise TypeError
 
 class PatientService:
     """Servicio para actualizar información de pacientes en Firestore."""
 
     def __init__(self):
-        self.db = firestore.client()
-
-    def _to_json_safe(self, obj):
-        try:
-            if isinstance(obj, dict):
-                return {k: self._to_json_safe(v) for k, v in obj.items()}
-            
-            if isinstance(obj, list):
-                return [self._to_json_safe(i) for i in obj]
-
-            if isinstance(obj, list):
-                return [self._to_json_safe(i) for i in obj]
-            
-            if isinstance(obj, tuple):
-                return tuple(self._to_json_safe(i) for i in obj)
-            
-            if isinstance(obj, (date, datetime)):
-                return obj.isoformat()
-            
-            if hasattr(obj, "path") and obj.__class__.__name__.endswith("DocumentReference"):
-                return obj.path
-            
-            if hasattr(obj, "latitude") and hasattr(obj, "longitude") and obj.__class__.__name__.endswith("GeoPoint"):
-                return {"latitude": obj.latitude, "longitude": obj.longitude}
-            
-            if isinstance(obj, (bytes, bytearray)):
-                return obj.decode("utf-8", errors="ignore")
-            return obj
-        except Exception as e:
-            logging.error(f'Error converting to JSON safe: {e}')
-            return str(obj)
+        self.db = get_firestore_client()
 
     def handle_request(self, request: Request) -> Response:
         request_json = request.get_json(silent=True)
 
         if not request_json:
-            body = json.dumps({
-                "success": False,
-                "error": "No JSON body found"
-            })
-            return Response(
-                body,
-                status=400,
-                headers={"Content-Type": "application/json"}
-            )
+            body = _NO_JSON_BODY
+            return _json_response(body, 400)
 
         patient_id = request_json.get('uid')
         new_info = request_json.get('new_info')
@@ -64,44 +136,52 @@ class PatientService:
         ficha_medica_info = request_json.get('ficha_medica_info')
 
         if not patient_id:
-            body = json.dumps({
-                "success": False,
-                "error": "Invalid request: Missing required field 'ref_patient'"
-            })
-            return Response(
-                body,
-                status=400,
-                headers={"Content-Type": "application/json"}
-            )
+            body = _MISSING_PATIENT_ID_BODY
+            return _json_response(body, 400)
 
         try:
-            sigsa_ref = self.update_sigsa_info_in_firestore(patient_id, sigsa_info)
-            ficha_medica_ref = self.update_medical_record_in_firestore(patient_id, ficha_medica_info)
-            self.update_patient_info_in_firestore(patient_id, new_info, sigsa_ref, ficha_medica_ref)
-            body = json.dumps({"success": True})
-            return Response(
-                body,
-                status=200,
-                headers={"Content-Type": "application/json"}
+            sigsa_ref, sigsa_data = self.update_sigsa_info_in_firestore(patient_id, sigsa_info)
+            ficha_medica_ref, ficha_medica_data = self.update_medical_record_in_firestore(patient_id, ficha_medica_info)
+            patient_ref, patient_data = self.update_patient_info_in_firestore(
+                patient_id, new_info, sigsa_ref, ficha_medica_ref
             )
+            # Las tres escrituras viajan en un solo commit atómico
+            batch = self.db.batch()
+            batch.set(sigsa_ref, sigsa_data, merge=True)
+            batch.set(ficha_medica_ref, ficha_medica_data, merge=True)
+            batch.set(patient_ref, patient_data, merge=True)
+            batch.commit()
+            logging.info(f'Patient, SIGSA and medical record updated for {patient_id}')
+            body = _SUCCESS_BODY
+            return _json_response(body, 200)
         except Exception as e:
             logging.error(f'Unhandled error in handle_request: {e}')
-            body = json.dumps({
+            body = orjson.dumps({
                 "success": False,
                 "error": str(e)
             })
-            return Response(
-                body,
-                status=500,
-                headers={"Content-Type": "application/json"}
-            )
-        finally:
-            # Cerrar cliente si tiene método close
-            try:
-                if hasattr(self.db, 'close'):
-                    self.db.close()
-            except Exception:
-                pass
+            return _json_response(body, 500)
+
+    def _get_doc_cached(self, collection: str, uid: str, request: Request) -> dict | None:
+        """Lee un documento por UID pasando por la caché de los GET; None si no existe."""
+        key = (collection, uid)
+        now = time.monotonic()
+        with _doc_cache_lock:
+            hit = _doc_cache.get(key)
+        if hit is not None and now - hit[0] < _DOC_CACHE_TTL and request.args.get("nocache") != "1":
+            return hit[1]
+        doc = self.db.collection(collection).document(uid).get()
+        if not doc.exists:
+            with _doc_cache_lock:
+                _doc_cache.pop(key, None)
+            return None
+        data = doc.to_dict()
+        with _doc_cache_lock:
+            if len(_doc_cache) >= _DOC_CACHE_MAX:
+                # Se descarta la entrada más antigua (los dict conservan el orden de inserción)
+                _doc_cache.pop(next(iter(_doc_cache)), None)
+            _doc_cache[key] = (now, data)
+        return data
 
     def update_patient_info_in_firestore(
             self,
@@ -109,24 +189,14 @@ class PatientService:
             new_info: dict,
             sigsa_ref: firestore.firestore.DocumentReference,
             ficha_medica_ref: firestore.firestore.DocumentReference
-        ) -> None:
-        """Actualiza los datos del paciente en la colección 'info_paciente'."""
+        ) -> tuple[firestore.firestore.DocumentReference, dict]:
+        """Prepara los datos del paciente para la colección 'pacientes' (la escritura la hace handle_request)."""
         try:
             logging.info(f'Updating patient information for {patient_id} with {new_info}')
-            info_patient = Paciente(
-                uid=patient_id,
-                nombre=new_info.get("nombre"),
-                apellido=new_info.get("apellido"),
-                fecha_consulta=new_info.get("fecha_consulta"),
-                estado_paciente=new_info.get("estado_paciente"),
-                ref_sigsa=sigsa_ref,
-                ref_ficha_medica=ficha_medica_ref
-            )
-            logging.info(f'New patient info: {json.dumps(info_patient, default=str)}')
+            patient_data = {k: v for k, v in new_info.items() if k in _PACIENTE_INPUT_FIELDS}
+            patient_data.update(uid=patient_id, ref_sigsa=sigsa_ref, ref_ficha_medica=ficha_medica_ref)
             patient_ref = self.db.collection('pacientes').document(patient_id)
-            # Guardar únicamente new_info pero también se podría guardar info_patient dependiendo del diseño
-            patient_ref.set(info_patient.__dict__, merge=True)
-            logging.info(f'Patient information updated for {patient_ref.id}')
+            return patient_ref, patient_data
         except Exception as e:
             logging.error(f'Error updating patient information: {e}')
             raise
@@ -135,46 +205,23 @@ class PatientService:
             self,
             patient_id: str,
             sigsa_info: dict,
-        ) -> firestore.firestore.DocumentReference:
-        """Actualiza o crea el documento SIGSA del paciente en 'sigsa'."""
+        ) -> tuple[firestore.firestore.DocumentReference, dict]:
+        """Crea el documento SIGSA si no existe y prepara su actualización en 'sigsa'."""
         try:
-            documents = self.db.collection('sigsa').get()
             doc = self.db.collection('sigsa').document(patient_id)
 
             if not doc.get().exists:
-                documents_len = len(documents)
-                new_id = documents_len + 1
                 logging.info(f'Creating new SIGSA document for {patient_id}')
-                doc.set({
-                    "created": firestore.firestore.SERVER_TIMESTAMP,
-                    "no_historia_clinica": new_id
-                })
+                _crear_sigsa_con_numero(
+                    self.db.transaction(),
+                    doc,
+                    self.db.collection('counters').document('sigsa'),
+                )
 
             logging.info(f'Updating SIGSA information for {patient_id} with {sigsa_info}')
-            sigsa_data = Sigsa(
-                uid=patient_id,
-                fecha_consulta=sigsa_info.get("fecha_consulta"),
-                nombre=sigsa_info.get("nombre"),
-                apellido=sigsa_info.get("apellido"),
-                cui=sigsa_info.get("cui"),
-                fecha_nacimiento=sigsa_info.get("fecha_nacimiento"),
-                edad=sigsa_info.get("edad"),
-                ninio_menor_15=sigsa_info.get("ninio_menor_15"),
-                adulto=sigsa_info.get("adulto"),
-                genero=sigsa_info.get("genero"),
-                municipio=sigsa_info.get("municipio"),
-                aldea=sigsa_info.get("aldea"),
-                embarazo=sigsa_info.get("embarazo"),
-                consulta=sigsa_info.get("consulta"),
-                diagnostico=sigsa_info.get("diagnostico"),
-                cie_10=sigsa_info.get("cie_10"),
-                terapia=sigsa_info.get("terapia"),
-            )
-            logging.info(f'New SIGSA info: {json.dumps(sigsa_data, default=str)}')
-            sigsa_ref = self.db.collection('sigsa').document(patient_id)
-            sigsa_ref.set(sigsa_data.__dict__, merge=True)
-            logging.info(f'SIGSA information updated for {sigsa_ref.id}')
-            return sigsa_ref
+            sigsa_data = {k: v for k, v in sigsa_info.items() if k in _SIGSA_INPUT_FIELDS}
+            sigsa_data['uid'] = patient_id
+            return doc, sigsa_data
         except Exception as e:
             logging.error(f'Error updating SIGSA information: {e}')
             raise
@@ -183,348 +230,323 @@ class PatientService:
             self,
             patient_id: str,
             medical_record: dict,
-        ) -> firestore.firestore.DocumentReference:
-        """Actualiza la ficha médica del paciente en 'fichas_medicas'."""
+        ) -> tuple[firestore.firestore.DocumentReference, dict]:
+        """Prepara la ficha médica del paciente para 'fichas_medicas'."""
         try:
             logging.info(f'Updating medical record for {patient_id} with {medical_record}')
-            medical_record_data = FichaMedica(
-                uid=patient_id,
-                patologia=medical_record.get("patologia"),
-                cui=medical_record.get("cui"),
-                escolaridad=medical_record.get("escolaridad"),
-                edad=medical_record.get("edad"),
-                ocupacion=medical_record.get("ocupacion"),
-                aldea=medical_record.get("aldea"),
-                estado_civil=medical_record.get("estado_civil"),
-                paciente_referido=medical_record.get("paciente_referido"),
-                genero=medical_record.get("genero"),
-                municipio=medical_record.get("municipio"),
-                cei10=medical_record.get("cei10"),
-                tipo_consulta=medical_record.get("tipo_consulta"),
-                tipo_terapia=medical_record.get("tipo_terapia"),
-                embarazo=medical_record.get("embarazo"),
-            )
-            logging.info(f'New medical record: {json.dumps(medical_record_data, default=str)}')
+            medical_record_data = {k: v for k, v in medical_record.items() if k in _FICHA_MEDICA_INPUT_FIELDS}
+            medical_record_data['uid'] = patient_id
             ficha_medica_ref = self.db.collection('fichas_medicas').document(patient_id)
-            ficha_medica_ref.set(medical_record_data.__dict__, merge=True)
-            logging.info(f'Medical record updated for {ficha_medica_ref.id}')
-            return ficha_medica_ref
+            return ficha_medica_ref, medical_record_data
         except Exception as e:
             logging.error(f'Error updating medical record: {e}')
             raise
     
     def get_patient_info(self, request: Request) -> Response:
         if request.method != 'GET':
-            body = json.dumps({
-                "success": False,
-                "error": "Invalid HTTP method. Only GET requests are allowed."
-            })
-            return Response(
-                body,
-                status=405,
-                headers={"Content-Type": "application/json"}
-            )
+            body = _INVALID_METHOD_BODY
+            return _json_response(body, 405)
 
         request_json = request.get_json(silent=True)
         if not request_json:
-            body = json.dumps({
-                "success": False,
-                "error": "No JSON body found"
-            })
+            body = _NO_JSON_BODY
             logging.error("No JSON body found in request")
-            return Response(
-                body,
-                status=400,
-                headers={"Content-Type": "application/json"}
-            )
+            return _json_response(body, 400)
 
         uid = request_json.get('uid')
 
         try:
             if not uid:
-                body = json.dumps({
-                    "success": False,
-                    "error": "Petición inválida: Falta el campo requerido 'uid'"
-                })
+                body = _FALTA_UID_BODY
                 logging.error("Falta el campo requerido 'uid'")
-                return Response(
-                    body,
-                    status=400,
-                    headers={"Content-Type": "application/json"}
-                )
+                return _json_response(body, 400)
 
-            paciente_ref = self.db.collection('pacientes').document(uid)
-            paciente_doc = paciente_ref.get()
-            if paciente_doc.exists:
-                raw = paciente_doc.to_dict()
-                safe = self._to_json_safe(raw)
-                paciente_obj = Paciente(**safe)
-                logging.info(f"Los datos encontrasdos son: {safe}")
-                body = json.dumps({
+            raw = self._get_doc_cached('pacientes', uid, request)
+            if raw is not None:
+                logging.info("Los datos encontrasdos son: %s", raw)
+                body = orjson.dumps({
                     "success": True,
-                    "data": paciente_obj.__dict__
-                })
+                    "data": {k: raw.get(k) for k in _PACIENTE_FIELDS}
+                }, default=json_default)
             else:
-                body = json.dumps({
-                    "success": False,
-                    "error": "No se encontraron datos para el UID proporcionado"
-                })
-            return Response(
-                body,
-                status=200 if paciente_doc.exists else 404,
-                headers={"Content-Type": "application/json"}
-            )
+                body = _NO_ENCONTRADO_BODY
+            return _json_response(body, 200 if raw is not None else 404)
         except Exception as e:
             logging.error(f"Error fetching patient info for UID {uid}: {e}")
             raise
 
     def get_sigsa_info(self, request: Request) -> Response:
         if request.method != 'GET':
-            body = json.dumps({
-                "success": False,
-                "error": "Método HTTP inválido. Solo se permiten solicitudes GET."
-            })
-            return Response(
-                body,
-                status=405,
-                headers={"Content-Type": "application/json"}
-            )
+            body = _METODO_INVALIDO_BODY
+            return _json_response(body, 405)
         
         request_json = request.get_json(silent=True)
         if not request_json:
-            body = json.dumps({
-                "success": False,
-                "error": "No JSON body found"
-            })
+            body = _NO_JSON_BODY
             logging.error("No JSON body found in request")
-            return Response(
-                body,
-                status=400,
-                headers={"Content-Type": "application/json"}
-            )
+            return _json_response(body, 400)
 
         uid = request_json.get('uid')
         
         try:
             if not uid:
-                body = json.dumps({
-                    "success": False,
-                    "error": "Petición inválida: Falta el campo requerido 'uid'"
-                })
+                body = _FALTA_UID_BODY
                 logging.error("Falta el campo requerido 'uid'")
-                return Response(
-                    body,
-                    status=400,
-                    headers={"Content-Type": "application/json"}
-                )
+                return _json_response(body, 400)
             
-            sigsa_ref = self.db.collection('sigsa').document(uid)
-            sigsa_doc = sigsa_ref.get()
-            if sigsa_doc.exists:
-                raw = sigsa_doc.to_dict()
-                safe = self._to_json_safe(raw)
-                sigsa_obj = Sigsa(**safe)
-                logging.info(f"Los datos encontrasdos son: {safe}")
-                body = json.dumps({
+            raw = self._get_doc_cached('sigsa', uid, request)
+            if raw is not None:
+                logging.info("Los datos encontrasdos son: %s", raw)
+                body = orjson.dumps({
                     "success": True,
-                    "data": sigsa_obj.__dict__
-                })
+                    "data": {k: raw.get(k) for k in _SIGSA_FIELDS}
+                }, default=json_default)
             else:
-                body = json.dumps({
-                    "success": False,
-                    "error": "No se encontraron datos para el UID proporcionado"
-                })
-            return Response(
-                body,
-                status=200 if sigsa_doc.exists else 404,
-                headers={"Content-Type": "application/json"}
-            )
+                body = _NO_ENCONTRADO_BODY
+            return _json_response(body, 200 if raw is not None else 404)
         except Exception as e:
             logging.error(f"Error fetching SIGSA info for UID {uid}: {e}")
             raise
 
     def get_medical_record(self, request: Request) -> Response:
         if request.method != 'GET':
-            body = json.dumps({
-                "success": False,
-                "error": "Método HTTP inválido. Solo se permiten solicitudes GET."
-            })
-            return Response(
-                body,
-                status=405,
-                headers={"Content-Type": "application/json"}
-            )
+            body = _METODO_INVALIDO_BODY
+            return _json_response(body, 405)
         
         request_json = request.get_json(silent=True)
         if not request_json:
-            body = json.dumps({
-                "success": False,
-                "error": "No JSON body found"
-            })
+            body = _NO_JSON_BODY
             logging.error("No JSON body found in request")
-            return Response(
-                body,
-                status=400,
-                headers={"Content-Type": "application/json"}
-            )
+            return _json_response(body, 400)
 
         uid = request_json.get('uid')
 
         try:
             if not uid:
-                body = json.dumps({
-                    "success": False,
-                    "error": "Petición inválida: Falta el campo requerido 'uid'"
-                })
+                body = _FALTA_UID_BODY
                 logging.error("Falta el campo requerido 'uid'")
-                return Response(
-                    body,
-                    status=400,
-                    headers={"Content-Type": "application/json"}
-                )
+                return _json_response(body, 400)
 
-            ficha_medica_ref = self.db.collection('fichas_medicas').document(uid)
-            ficha_medica_doc = ficha_medica_ref.get()
-            if ficha_medica_doc.exists:
-                raw = ficha_medica_doc.to_dict()
-                safe = self._to_json_safe(raw)
-                ficha_medica_obj = FichaMedica(**safe)
-                logging.info(f"Los datos encontrasdos son: {safe}")
-                body = json.dumps({
+            raw = self._get_doc_cached('fichas_medicas', uid, request)
+            if raw is not None:
+                logging.info("Los datos encontrasdos son: %s", raw)
+                body = orjson.dumps({
                     "success": True,
-                    "data": ficha_medica_obj.__dict__
-                })
+                    "data": {k: raw.get(k) for k in _FICHA_MEDICA_FIELDS}
+                }, default=json_default)
             else:
-                body = json.dumps({
-                    "success": False,
-                    "error": "No se encontraron datos para el UID proporcionado"
-                })
-            return Response(
-                body,
-                status=200 if ficha_medica_doc.exists else 404,
-                headers={"Content-Type": "application/json"}
-            )
+                body = _NO_ENCONTRADO_BODY
+            return _json_response(body, 200 if raw is not None else 404)
         except Exception as e:
             logging.error(f"Error fetching medical record for UID {uid}: {e}")
             raise
 
-    def get_all_patients(self) -> list[AllInfo]:
+    def get_all_info(self, uid: str) -> AllInfo:
+        """Obtiene paciente, ficha médica y SIGSA de un UID en una sola lectura por lotes."""
         try:
-            patients = self.db.collection('pacientes').stream()
-            sigsa = self.db.collection('sigsa').stream()
-            ficha_medica = self.db.collection('fichas_medicas').stream()
-            # Obtener todas las colecciones
-            patients_docs = list(patients)
-            sigsa_docs = list(sigsa)
-            ficha_medica_docs = list(ficha_medica)
-
-            # Crear diccionarios indexados por UID
-            sigsa_dict = {doc.id: self._to_json_safe(doc.to_dict()) for doc in sigsa_docs}
-            ficha_medica_dict = {doc.id: self._to_json_safe(doc.to_dict()) for doc in ficha_medica_docs}
-            
-            all_info = []
-            
-            for patient_doc in patients_docs:
-                patient_uid = patient_doc.id
-                patient_data = self._to_json_safe(patient_doc.to_dict())
-                patient_data['uid'] = patient_uid
-                
-                # Obtener datos relacionados
-                sigsa_data = sigsa_dict.get(patient_uid, {'uid': patient_uid})
-                ficha_medica_data = ficha_medica_dict.get(patient_uid, {'uid': patient_uid})
-                
-                # Asegurar que los datos tengan UID
-                if 'uid' not in sigsa_data:
-                    sigsa_data['uid'] = patient_uid
-                if 'uid' not in ficha_medica_data:
-                    ficha_medica_data['uid'] = patient_uid
-                
-                try:
-                    # Crear instancias de los modelos
-                    paciente_obj = Paciente(**patient_data)
-                    sigsa_obj = Sigsa(**sigsa_data)
-                    ficha_medica_obj = FichaMedica(**ficha_medica_data)
-                    logging.warn(f"Paciente: {paciente_obj.__dict__}")
-                    logging.warn(f"SIGSA: {sigsa_obj.__dict__}")
-                    logging.warn(f"Ficha Médica: {ficha_medica_obj.__dict__}")
-                    
-                    # Crear objeto AllInfo
-                    info = AllInfo(
-                        paciente=paciente_obj,
-                        sigsa=sigsa_obj,
-                        ficha_medica=ficha_medica_obj
-                    )
-                    logging.warn(f"AllInfo: {info}")
-                    all_info.append(info)
-                    logging.warn(f"Added AllInfo for patient UID {patient_uid}")
-                    logging.warn(f"Current total patients: {len(all_info)}")
-                    logging.warn(f"Patient data: {all_info}")
-
-                except Exception as e:
-                    logging.error(f"Error creating models for patient {patient_uid}: {e}")
-                    logging.error(f"Patient data: {patient_data}")
-                    logging.error(f"SIGSA data: {sigsa_data}")
-                    logging.error(f"Ficha médica data: {ficha_medica_data}")
-                    continue
-            
-    
-            logging.info(f"Total patients fetched: {all_info}")
-            return all_info
+            paciente_ref = self.db.collection('pacientes').document(uid)
+            ficha_medica_ref = self.db.collection('fichas_medicas').document(uid)
+            sigsa_ref = self.db.collection('sigsa').document(uid)
+            # get_all no garantiza el orden, se indexa por ruta del documento
+            snapshots = {
+                doc.reference.path: doc
+                for doc in self.db.get_all([paciente_ref, ficha_medica_ref, sigsa_ref])
+            }
+            return AllInfo.from_snapshots(
+                paciente=snapshots.get(paciente_ref.path),
+                ficha_medica=snapshots.get(ficha_medica_ref.path),
+                sigsa=snapshots.get(sigsa_ref.path),
+            )
+        except Exception as e:
+            logging.error(f"Error fetching all info for UID {uid}: {e}")
+            raise
+
+    def get_combined_info(self, request: Request) -> Response:
+        """Devuelve paciente, SIGSA y ficha médica de un UID en una sola respuesta."""
+        if request.method != 'GET':
+            body = _METODO_INVALIDO_BODY
+            return _json_response(body, 405)
+
+        request_json = request.get_json(silent=True)
+        if not request_json:
+            body = _NO_JSON_BODY
+            logging.error("No JSON body found in request")
+            return _json_response(body, 400)
+
+        uid = request_json.get('uid')
+
+        try:
+            if not uid:
+                body = _FALTA_UID_BODY
+                logging.error("Falta el campo requerido 'uid'")
+                return _json_response(body, 400)
+
+            # Un solo BatchGetDocuments en lugar de tres lecturas por separado
+            info = self.get_all_info(uid)
+            found = any((info.paciente, info.sigsa, info.ficha_medica))
+            if found:
+                body = orjson.dumps({
+                    "success": True,
+                    "data": {
+                        "uid": uid,
+                        "paciente": model_to_dict(info.paciente) if info.paciente else None,
+                        "sigsa": model_to_dict(info.sigsa) if info.sigsa else None,
+                        "ficha_medica": model_to_dict(info.ficha_medica) if info.ficha_medica else None,
+                    }
+                }, default=json_default)
+            else:
+                body = _NO_ENCONTRADO_BODY
+            return _json_response(body, 200 if found else 404)
+        except Exception as e:
+            logging.error(f"Error fetching combined info for UID {uid}: {e}")
+            raise
+
+    def _get_docs_by_uid(self, collection, uids: list[str], fields: tuple[str, ...]) -> dict:
+        """Lee con un solo get_all los documentos de `collection` para los UIDs dados."""
+        refs = [collection.document(uid) for uid in uids]
+        return {
+            doc.id: doc.to_dict()
+            for doc in self.db.get_all(refs, field_paths=fields)
+            if doc.exists
+        }
+
+    def iter_all_patients(self, page_size: int = 500) -> Iterator[AllInfo]:
+        """
+        Recorre todos los pacientes por páginas ordenadas por ID de documento.
+        Por cada página solo se leen los SIGSA y fichas médicas de esos pacientes,
+        así la memoria depende del tamaño de página y no del total de pacientes.
+        """
+        query = (
+            self.db.collection('pacientes')
+            .select(_PACIENTE_FIELDS)
+            .order_by(firestore.firestore.FieldPath.document_id())
+            .limit(page_size)
+        )
+        sigsa_col = self.db.collection('sigsa')
+        ficha_medica_col = self.db.collection('fichas_medicas')
+        last_doc = None
+        total = 0
+        try:
+            while True:
+                page = query.start_after(last_doc) if last_doc is not None else query
+                patients_docs = list(page.stream())
+                if not patients_docs:
+                    break
+
+                # SIGSA y fichas de la página a la vez, un get_all para cada colección
+                uids = [doc.id for doc in patients_docs]
+                sigsa = _io_pool.submit(self._get_docs_by_uid, sigsa_col, uids, _SIGSA_FIELDS)
+                ficha_medica = _io_pool.submit(
+                    self._get_docs_by_uid, ficha_medica_col, uids, _FICHA_MEDICA_FIELDS
+                )
+                sigsa_dict = sigsa.result()
+                ficha_medica_dict = ficha_medica.result()
+
+                for patient_doc in patients_docs:
+                    patient_uid = patient_doc.id
+                    patient_data = patient_doc.to_dict()
+                    patient_data['uid'] = patient_uid
+
+                    # Obtener datos relacionados
+                    sigsa_data = sigsa_dict.get(patient_uid, {'uid': patient_uid})
+                    ficha_medica_data = ficha_medica_dict.get(patient_uid, {'uid': patient_uid})
+
+                    # Asegurar que los datos tengan UID
+                    if 'uid' not in sigsa_data:
+                        sigsa_data['uid'] = patient_uid
+                    if 'uid' not in ficha_medica_data:
+                        ficha_medica_data['uid'] = patient_uid
+
+                    try:
+                        # Crear instancias de los modelos
+                        info = AllInfo(
+                            paciente=Paciente(**patient_data),
+                            sigsa=Sigsa(**sigsa_data),
+                            ficha_medica=FichaMedica(**ficha_medica_data)
+                        )
+                    except Exception as e:
+                        logging.error(f"Error creating models for patient {patient_uid}: {e}")
+                        logging.error(f"Patient data: {patient_data}")
+                        logging.error(f"SIGSA data: {sigsa_data}")
+                        logging.error(f"Ficha médica data: {ficha_medica_data}")
+                        continue
+
+                    # Formato perezoso: el repr solo se construye si DEBUG está activo
+                    logging.debug("AllInfo for patient UID %s: %s", patient_uid, info)
+                    total += 1
+                    yield info
+
+                if len(patients_docs) < page_size:
+                    break
+                last_doc = patients_docs[-1]
+
+            logging.info("Total patients fetched: %d", total)
         except Exception as e:
             logging.error(f"Error fetching all patients: {e}")
             raise
-    
-    def close(self):
+
+    def get_all_patients(self) -> list[AllInfo]:
+        return list(self.iter_all_patients())
+
+    def close(self, shutdown: bool = False):
+        """
+        No hace nada salvo con `shutdown=True`: el cliente de Firestore es compartido
+        por todo el contenedor y cerrarlo tiraría el canal gRPC de las demás peticiones.
+        Args:
+            shutdown: Cierra de verdad el cliente (solo al terminar el proceso).
+        """
+        if not shutdown:
+            return
         try:
-            if hasattr(self.db, 'close'):
-                self.db.close()
+            self.db.close()
         except Exception as e:
             logging.error(f'Error closing Firestore client: {e}')
 
+
+@functools.lru_cache(maxsize=1)
+def _get_service() -> PatientService:
+    """Devuelve el servicio de pacientes del contenedor, creándolo la primera vez."""
+    service = PatientService()
+    # El cliente solo se cierra cuando termina el intérprete
+    atexit.register(service.close, shutdown=True)
+    return service
+
 # Función de entrada compatible con Cloud Functions que delega en la clase
 def update_patient_information(request: Request) -> Response:
-    service = PatientService()
-    response = service.handle_request(request)
-    service.close()
-    return response
+    return _get_service().handle_request(request)
 
 # Función para obtener información del paciente
 def get_patient_information(request: Request) -> Response:
-    service = PatientService()
-    response = service.get_patient_info(request)
-    service.close()
-    return response
+    return _get_service().get_patient_info(request)
 
 # Función para obtener información de SIGSA
 def get_sigsa_information(request: Request) -> Response:
-    service = PatientService()
-    response = service.get_sigsa_info(request)
-    service.close()
-    return response
+    return _get_service().get_sigsa_info(request)
 
 # Función para obtener información de la ficha médica
 def get_medical_record_information(request: Request) -> Response:
-    service = PatientService()
-    response = service.get_medical_record(request)
-    service.close()
-    return response
+    return _get_service().get_medical_record(request)
 
+# Función para obtener paciente, SIGSA y ficha médica en una sola llamada
+def get_combined_information(request: Request) -> Response:
+    return _get_service().get_combined_info(request)
 
-def get_all_patients() -> list[AllInfo]:
-    service = PatientService()
-    patients = service.get_all_patients()
-    logging.info(f"Patients retrieved: {patients}")
-    patient_data = []
-    for patient in patients:
+
+def stream_all_patients() -> Iterator[dict]:
+    """Genera la información de cada paciente como diccionario, uno a la vez."""
+    # Se consume página a página: nunca se tiene la lista completa en memoria
+    for patient in _get_service().iter_all_patients():
         try:
-            patient_data.append({
+            yield {
                 "uid": patient.paciente.uid if patient.paciente else None,
-                "paciente": patient.paciente.__dict__ if patient.paciente else None,
-                "sigsa": patient.sigsa.__dict__ if patient.sigsa else None,
-                "ficha_medica": patient.ficha_medica.__dict__ if patient.ficha_medica else None,
-            })
+                "paciente": model_to_dict(patient.paciente) if patient.paciente else None,
+                "sigsa": model_to_dict(patient.sigsa) if patient.sigsa else None,
+                "ficha_medica": model_to_dict(patient.ficha_medica) if patient.ficha_medica else None,
+            }
         except Exception as e:
             logging.error(f"Error converting patient to dict: {e}")
             continue
-    service.close()
-    return patient_data
\ No newline at end of file
+
+
+def get_all_patients() -> list[dict]:
+    return list(stream_all_patients())
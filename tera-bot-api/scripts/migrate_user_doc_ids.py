@@ -0,0 +1,59 @@
+import sys
+import os
+
+# Add functions directory to path to import the login helpers
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "functions"))
+
+from google.api_core.exceptions import AlreadyExists
+
+from src.services.firebase.firestore_client import get_firestore_client
+from src.services.login.create_user import user_doc_id
+
+
+def migrate_user_doc_ids(dry_run: bool = False) -> tuple[int, list[str]]:
+    """
+    Mueve los documentos de 'users' creados con ID automático al ID derivado del
+    nombre de usuario (user_doc_id). El UID del paciente no cambia: el documento
+    conserva 'ref_paciente', que apunta a pacientes/{ID anterior}.
+    Returns:
+        (número de usuarios migrados, IDs de los que no se migraron porque ya
+        existe una cuenta con ese nombre de usuario).
+    """
+    db = get_firestore_client()
+    migrated = 0
+    conflicts = []
+    for doc in db.collection('users').stream():
+        data = doc.to_dict() or {}
+        usuario = data.get('usuario')
+        if not usuario:
+            print(f"Skipping user without name: {doc.id}")
+            continue
+        new_id = user_doc_id(usuario)
+        if doc.id == new_id:
+            continue
+
+        data.setdefault('ref_paciente', db.collection('pacientes').document(doc.id))
+        print(f"{doc.id} -> {new_id} ({usuario})")
+        if not dry_run:
+            batch = db.batch()
+            # create() falla si ya existe una cuenta con ese nombre: se reporta,
+            # se deja el documento como está y se revisa a mano
+            batch.create(db.collection('users').document(new_id), data)
+            batch.delete(doc.reference)
+            try:
+                batch.commit()
+            except AlreadyExists:
+                print(f"✗ Conflict: {doc.id} ({usuario}) -> users/{new_id} already exists, skipped")
+                conflicts.append(doc.id)
+                continue
+        migrated += 1
+    return migrated, conflicts
+
+
+if __name__ == "__main__":
+    dry_run = "--dry-run" in sys.argv
+    total, conflicts = migrate_user_doc_ids(dry_run=dry_run)
+    print(f"✓ {total} users {'to migrate' if dry_run else 'migrated'}")
+    if conflicts:
+        print(f"✗ {len(conflicts)} users skipped by conflict: {', '.join(conflicts)}")
+        sys.exit(1)